@@ -6,98 +6,29 @@ Builds a standalone executable package for the Calendar Pro application.
 
 import os
 import sys
+import shlex
 import shutil
 import subprocess
+import threading
+import uuid
+from importlib.metadata import distributions
 from pathlib import Path
 
+# Use 1 MiB chunks when shutil has to fall back to a read/write copy loop
+# (e.g. copying the executable across drives)
+shutil.COPY_BUFSIZE = 1024 * 1024
 
-def print_status(message):
-    """Print status message with formatting."""
-    print(f"\n{'='*60}")
-    print(f"📦 {message}")
-    print(f"{'='*60}")
-
-
-def run_command(command, description):
-    """Run a command and handle errors."""
-    print(f"\n🔧 {description}...")
-    print(f"Command: {command}")
-
-    result = subprocess.run(command, shell=True,
-                            capture_output=True, text=True)
-
-    if result.returncode == 0:
-        print(f"✅ {description} completed successfully!")
-        if result.stdout:
-            print("Output:", result.stdout.strip())
-    else:
-        print(f"❌ {description} failed!")
-        print("Error:", result.stderr.strip())
-        return False
-    return True
-
-
-def clean_previous_builds():
-    """Clean up previous build artifacts."""
-    print_status("Cleaning Previous Builds")
-
-    dirs_to_clean = ['build', 'dist', '__pycache__']
-    files_to_clean = ['*.spec']
-
-    for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
-            print(f"🗑️  Removing directory: {dir_name}")
-            shutil.rmtree(dir_name)
-        else:
-            print(f"📁 Directory {dir_name} not found (OK)")
-
-    # Remove .spec files
-    for spec_file in Path('.').glob('*.spec'):
-        print(f"🗑️  Removing spec file: {spec_file}")
-        spec_file.unlink()
-
+# Values shared across build steps
+PYTHON_EXECUTABLE = sys.executable
+PROJECT_DIR = '.'
+REQUIRED_PACKAGES = ('customtkinter', 'Pillow', 'pyinstaller')
 
-def check_dependencies():
-    """Check if all required dependencies are installed."""
-    print_status("Checking Dependencies")
+# PyInstaller's work directory lives outside the project so that cleaning
+# build/ doesn't throw away its analysis cache between runs
+BUILD_WORK_DIR = Path.home() / '.cache' / 'calpro_build'
 
-    required_packages = ['customtkinter', 'Pillow', 'pyinstaller']
-
-    for package in required_packages:
-        try:
-            result = subprocess.run([sys.executable, '-c', f'import {package}'],
-                                    capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✅ {package} is installed")
-            else:
-                print(f"❌ {package} is not installed")
-                return False
-        except Exception as e:
-            print(f"❌ Error checking {package}: {e}")
-            return False
-
-    return True
-
-
-def install_dependencies():
-    """Install dependencies from requirements.txt."""
-    print_status("Installing Dependencies")
-
-    if not os.path.exists('requirements.txt'):
-        print("❌ requirements.txt not found!")
-        return False
-
-    return run_command(
-        f"{sys.executable} -m pip install -r requirements.txt",
-        "Installing requirements"
-    )
-
-
-def create_pyinstaller_spec():
-    """Create a custom PyInstaller spec file for better control."""
-    print_status("Creating PyInstaller Specification")
-
-    spec_content = '''# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for the app; {upx} and {console} are filled in per build
+_SPEC_TEMPLATE = '''# -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
 
@@ -118,7 +49,7 @@ a = Analysis(
         'tkinter.ttk',
     ],
     hookspath=[],
-    hooksconfig={},
+    hooksconfig={{}},
     runtime_hooks=[],
     excludes=[],
     win_no_prefer_redirects=False,
@@ -140,10 +71,10 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx={upx},
     upx_exclude=[],
     runtime_tmpdir=None,
-    console=False,  # Set to False for windowed application
+    console={console},  # Set to False for windowed application
     disable_windowed_traceback=False,
     argv_emulation=False,
     target_arch=None,
@@ -153,69 +84,14 @@ exe = EXE(
 )
 '''
 
-    with open('CalendarPro.spec', 'w') as f:
-        f.write(spec_content)
-
-    print("✅ PyInstaller spec file created: CalendarPro.spec")
-    return True
-
-
-def build_executable():
-    """Build the executable using PyInstaller."""
-    print_status("Building Executable")
-
-    # Build using the spec file for better control
-    return run_command(
-        "pyinstaller CalendarPro.spec --clean",
-        "Building executable with PyInstaller"
-    )
-
-
-def create_distribution_folder():
-    """Create a clean distribution folder with all necessary files."""
-    print_status("Creating Distribution Package")
-
-    dist_folder = "CalendarPro_Distribution"
-
-    # Create distribution folder
-    if os.path.exists(dist_folder):
-        shutil.rmtree(dist_folder)
-    os.makedirs(dist_folder)
-
-    # Copy executable
-    exe_source = os.path.join("dist", "CalendarPro.exe")
-    if os.path.exists(exe_source):
-        shutil.copy2(exe_source, dist_folder)
-        print(f"✅ Copied executable to {dist_folder}")
-    else:
-        print(f"❌ Executable not found at {exe_source}")
-        return False
-
-    # Copy documentation and license files
-    docs_to_copy = ['README.md']
-    for doc in docs_to_copy:
-        if os.path.exists(doc):
-            shutil.copy2(doc, dist_folder)
-            print(f"✅ Copied {doc}")
-
-    # Create a simple launcher script (optional)
-    launcher_content = '''@echo off
+# Files written alongside the executable in the distribution folder
+_LAUNCHER_CONTENT = '''@echo off
 echo Starting Calendar Pro...
 CalendarPro.exe
 pause
 '''
-    with open(os.path.join(dist_folder, "Start_CalendarPro.bat"), 'w') as f:
-        f.write(launcher_content)
-
-    print(f"✅ Distribution package created in: {dist_folder}")
-    return True
-
 
-def create_installer_info():
-    """Create installation instructions."""
-    print_status("Creating Installation Instructions")
-
-    instructions = '''# Calendar Pro - Installation Instructions
+_INSTALL_INSTRUCTIONS = '''# Calendar Pro - Installation Instructions
 
 ## Quick Start
 1. Extract all files to a folder of your choice
@@ -251,10 +127,253 @@ Packaged using PyInstaller
 For updates and source code, visit: https://github.com/umfhero/Calender
 '''
 
-    with open('CalendarPro_Distribution/INSTALL.txt', 'w') as f:
-        f.write(instructions)
 
-    print("✅ Installation instructions created")
+def print_status(message):
+    """Print status message with formatting."""
+    sys.stdout.write(f"\n{'='*60}\n📦 {message}\n{'='*60}\n")
+
+
+def run_command(command, description):
+    """Run a command (given as an argument list) and handle errors."""
+    print(f"\n🔧 {description}...")
+    print(f"Command: {shlex.join(command)}")
+
+    # Stream output as it arrives instead of buffering the whole log
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+
+    for line in process.stdout:
+        sys.stdout.write(line)
+
+    process.wait()
+
+    if process.returncode == 0:
+        print(f"✅ {description} completed successfully!")
+    else:
+        print(f"❌ {description} failed with return code: {process.returncode}")
+        return False
+    return True
+
+
+def clean_previous_builds():
+    """Clean up previous build artifacts."""
+    print_status("Cleaning Previous Builds")
+
+    dirs_to_clean = ['build', 'dist', '__pycache__']
+    for dir_name in dirs_to_clean:
+        # Move the directory aside so the build can start straight away,
+        # and delete the renamed copy in the background. The rename doubles
+        # as the existence check.
+        trash_name = f"{dir_name}.trash-{uuid.uuid4().hex}"
+        try:
+            os.rename(dir_name, trash_name)
+        except FileNotFoundError:
+            print(f"📁 Directory {dir_name} not found (OK)")
+            continue
+        except OSError:
+            print(f"🗑️  Removing directory: {dir_name}")
+            shutil.rmtree(dir_name, ignore_errors=True)
+            continue
+
+        print(f"🗑️  Removing directory: {dir_name}")
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(trash_name,),
+            kwargs={'ignore_errors': True}
+        ).start()
+
+    # Remove stale .spec files (CalendarPro.spec is kept so an unchanged
+    # spec doesn't invalidate PyInstaller's analysis cache)
+    with os.scandir(PROJECT_DIR) as entries:
+        spec_files = [entry.name for entry in entries
+                      if entry.is_file() and entry.name.endswith('.spec')
+                      and entry.name != 'CalendarPro.spec']
+    for spec_file in spec_files:
+        print(f"🗑️  Removing spec file: {spec_file}")
+        Path(spec_file).unlink(missing_ok=True)
+
+
+def check_dependencies():
+    """Check if all required dependencies are installed."""
+    print_status("Checking Dependencies")
+
+    # Snapshot the installed distributions once instead of importing each
+    # package in a fresh interpreter, then check the whole list against it
+    try:
+        installed = {dist.metadata['Name'].lower(): dist.version
+                     for dist in distributions() if dist.metadata['Name']}
+    except Exception as e:
+        print(f"❌ Error reading installed packages: {e}")
+        return False
+
+    missing_packages = []
+    for package in REQUIRED_PACKAGES:
+        package_version = installed.get(package.lower())
+        if package_version is not None:
+            print(f"✅ {package} is installed ({package_version})")
+        else:
+            print(f"❌ {package} is not installed")
+            missing_packages.append(package)
+
+    if missing_packages:
+        print(f"❌ Missing packages: {', '.join(missing_packages)}")
+        return False
+
+    return True
+
+
+def install_dependencies():
+    """Install dependencies from requirements.txt."""
+    print_status("Installing Dependencies")
+
+    if not os.path.exists('requirements.txt'):
+        print("❌ requirements.txt not found!")
+        return False
+
+    # Wheels only, so a missing package never triggers a source build, and
+    # skip pip's own self-update check
+    return run_command(
+        [PYTHON_EXECUTABLE, '-m', 'pip', 'install',
+         '--only-binary=:all:', '--disable-pip-version-check',
+         '-r', 'requirements.txt'],
+        "Installing requirements"
+    )
+
+
+def create_pyinstaller_spec():
+    """Create a custom PyInstaller spec file, returning whether it changed."""
+    print_status("Creating PyInstaller Specification")
+
+    # UPX compression is slow and only worth it for release builds
+    # (set CALPRO_RELEASE=1 to enable it)
+    upx_enabled = os.environ.get('CALPRO_RELEASE') == '1'
+    print(f"📦 UPX compression: {'enabled' if upx_enabled else 'disabled'}")
+
+    spec_content = _SPEC_TEMPLATE.format(upx=upx_enabled, console=False)
+
+    spec_bytes = spec_content.encode('utf-8')
+    spec_path = Path('CalendarPro.spec')
+
+    # Only rewrite the spec when its content changes so its mtime stays put
+    try:
+        existing_bytes = spec_path.read_bytes()
+    except FileNotFoundError:
+        existing_bytes = None
+
+    if existing_bytes == spec_bytes:
+        print("✅ PyInstaller spec file unchanged: CalendarPro.spec")
+        return False
+
+    # Write to a temp file and swap it in so an interrupted build never
+    # leaves a half-written spec behind
+    temp_path = spec_path.with_name(spec_path.name + '.tmp')
+    temp_path.write_bytes(spec_bytes)
+    os.replace(temp_path, spec_path)
+
+    print("✅ PyInstaller spec file created: CalendarPro.spec")
+    return True
+
+
+def needs_clean_build(spec_changed):
+    """Check whether PyInstaller's cached analysis is missing or stale."""
+    # PyInstaller re-runs Analysis itself when the sources change; only a
+    # new spec or a missing cache needs --clean (which also drops bincache)
+    analysis_toc = BUILD_WORK_DIR / 'CalendarPro' / 'Analysis-00.toc'
+    return spec_changed or not analysis_toc.exists()
+
+
+def build_executable(spec_changed):
+    """Build the executable using PyInstaller."""
+    print_status("Building Executable")
+
+    # Build using the spec file for better control, reusing the previous
+    # analysis unless the spec itself has changed
+    BUILD_WORK_DIR.mkdir(parents=True, exist_ok=True)
+    command = ['pyinstaller', 'CalendarPro.spec',
+               '--workpath', str(BUILD_WORK_DIR), '--distpath', 'dist']
+    if needs_clean_build(spec_changed):
+        command.append('--clean')
+
+    return run_command(command, "Building executable with PyInstaller")
+
+
+def copy_large_file(source, destination):
+    """Copy a large file with the OS's zero-copy API, bypassing shutil."""
+    if os.name == 'nt':
+        import ctypes
+        # CopyFileW does the whole copy inside the kernel
+        if ctypes.windll.kernel32.CopyFileW(str(source), str(destination), False):
+            return
+    elif hasattr(os, 'sendfile'):
+        try:
+            with open(source, 'rb') as fsrc, open(destination, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                offset = 0
+                while remaining > 0:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(),
+                                       offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+            if remaining == 0:
+                shutil.copystat(source, destination)
+                return
+        except OSError:
+            pass
+
+    # Fall back to shutil when the native copy isn't available
+    shutil.copy2(source, destination)
+
+
+def create_distribution_folder():
+    """Create a clean distribution folder with all necessary files."""
+    print_status("Creating Distribution Package")
+
+    dist_folder = "CalendarPro_Distribution"
+
+    # Create distribution folder
+    shutil.rmtree(dist_folder, ignore_errors=True)
+    os.makedirs(dist_folder)
+
+    # Copy executable. dist/ is wiped on the next build anyway, so move it
+    # rather than copying it; fall back to a copy across drives
+    exe_source = os.path.join("dist", "CalendarPro.exe")
+    exe_target = os.path.join(dist_folder, "CalendarPro.exe")
+    try:
+        os.replace(exe_source, exe_target)
+        print(f"✅ Moved executable to {dist_folder}")
+    except FileNotFoundError:
+        print(f"❌ Executable not found at {exe_source}")
+        return False
+    except OSError:
+        copy_large_file(exe_source, exe_target)
+        print(f"✅ Copied executable to {dist_folder}")
+
+    # Copy documentation and license files
+    docs_to_copy = ['README.md']
+    for doc in docs_to_copy:
+        try:
+            shutil.copy2(doc, dist_folder)
+            print(f"✅ Copied {doc}")
+        except FileNotFoundError:
+            pass
+
+    # Write the launcher script and installation instructions together
+    generated_files = {
+        "Start_CalendarPro.bat": _LAUNCHER_CONTENT.encode('utf-8'),
+        "INSTALL.txt": _INSTALL_INSTRUCTIONS.encode('utf-8'),
+    }
+    for file_name, data in generated_files.items():
+        Path(dist_folder, file_name).write_bytes(data)
+
+    print("✅ Launcher script and installation instructions created")
+    print(f"✅ Distribution package created in: {dist_folder}")
     return True
 
 
@@ -269,7 +388,8 @@ def main():
         return False
 
     try:
-        # Step 1: Clean previous builds
+        # Step 1: Clean previous builds (the old folders are deleted in the
+        # background, so this returns straight away)
         clean_previous_builds()
 
         # Step 2: Check dependencies
@@ -280,21 +400,16 @@ def main():
                 return False
 
         # Step 3: Create PyInstaller spec
-        if not create_pyinstaller_spec():
-            return False
+        spec_changed = create_pyinstaller_spec()
 
         # Step 4: Build executable
-        if not build_executable():
+        if not build_executable(spec_changed):
             return False
 
         # Step 5: Create distribution package
         if not create_distribution_folder():
             return False
 
-        # Step 6: Create installation instructions
-        if not create_installer_info():
-            return False
-
         print_status("Build Complete! 🎉")
         print("📁 Your packaged application is ready in: CalendarPro_Distribution/")
         print("📋 Installation instructions: CalendarPro_Distribution/INSTALL.txt")
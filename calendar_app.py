@@ -1,48 +1,161 @@
 import customtkinter as ctk
+import bisect
 import calendar
+import hashlib
 import json
 import os
+import stat
 import sys
+import tempfile
 import tkinter as tk
-from datetime import datetime
-from typing import Dict, List, Any
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
+from typing import Dict, List, Any, NamedTuple
 from PIL import Image, ImageTk
-from tkinter import filedialog
+from tkinter import filedialog, messagebox
+
+# Month name lookups, built once instead of re-scanning calendar.month_name
+_MONTH_NAMES = tuple(calendar.month_name)
+_MONTH_NUM = {name: i for i, name in enumerate(_MONTH_NAMES) if name}
+
+# One shared Calendar for laying out month grids
+_CALENDAR = calendar.Calendar()
+
+# Colour pairs (light, dark) shared by the month list and calendar views
+_FG_HIGHLIGHT = ("#0B2027", "#0B2027")
+_HOV_HIGHLIGHT = ("#1A3A47", "#1A3A47")
+_FG_NOTE = ("#6DB176", "#6DB176")
+_HOV_NOTE = ("#83CC8D", "#83CC8D")
+_FG_SELECTED = ("orange", "darkorange")
+_HOV_SELECTED = ("darkorange", "orange")
+_FG_DAY = ("gray95", "gray5")
+_HOV_DAY = ("gray90", "gray10")
+_FG_MONTH = ("gray90", "gray10")
+_HOV_MONTH = ("gray85", "gray15")
+_TXT_WHITE = ("white", "white")
+_TXT_DIM = ("gray20", "gray80")
+_FG_ACCENT = ("#482728", "#482728")
+_HOV_ACCENT = ("#5A3233", "#5A3233")
+_FG_DANGER = ("red", "darkred")
+_HOV_DANGER = ("darkred", "red")
+_FG_CANCEL = ("gray", "darkgray")
+_HOV_CANCEL = ("darkgray", "gray")
+_FG_PANEL = ("gray95", "gray10")
+_TXT_MUTED = ("gray40", "gray60")
+_TXT_SUBTLE = ("gray30", "gray70")
+_FG_TASK = ("#4A90E2", "#4A90E2")
+_FG_BLOCKED = ("#FF6B6B", "#FF6B6B")
+
+# Button colour options, built once and passed straight to configure()
+_MONTH_STYLE_CURRENT = {'fg_color': _FG_HIGHLIGHT,
+                        'hover_color': _HOV_HIGHLIGHT, 'text_color': _TXT_WHITE}
+_MONTH_STYLE_REGULAR = {'fg_color': _FG_MONTH,
+                        'hover_color': _HOV_MONTH, 'text_color': _TXT_DIM}
+_DAY_STYLE_SELECTED = {'fg_color': _FG_SELECTED,
+                       'hover_color': _HOV_SELECTED, 'text_color': _TXT_WHITE}
+_DAY_STYLE_TODAY = {'fg_color': _FG_HIGHLIGHT,
+                    'hover_color': _HOV_HIGHLIGHT, 'text_color': _TXT_WHITE}
+_DAY_STYLE_NOTES = {'fg_color': _FG_NOTE,
+                    'hover_color': _HOV_NOTE, 'text_color': _TXT_WHITE}
+_DAY_STYLE_REGULAR = {'fg_color': _FG_DAY,
+                      'hover_color': _HOV_DAY, 'text_color': _TXT_DIM}
+
+# Timetable axes (hourly slots from 6 AM to 10 PM in 12-hour format)
+_TIMETABLE_DAYS = ("Monday", "Tuesday", "Wednesday",
+                   "Thursday", "Friday", "Saturday", "Sunday")
+_TIME_SLOTS = tuple(
+    f"{(hour - 1) % 12 + 1}:00 {'AM' if hour < 12 else 'PM'}"
+    for hour in range(6, 22))
+
+# Timetable cell styles that don't depend on modules: type -> (text, colour)
+_EMPTY_CELL_STYLE = ("", _FG_PANEL, _TXT_MUTED)
+_CELL_STYLES = {
+    'task': (lambda cell_data: f"📋 {cell_data.get('task', '')}", _FG_TASK),
+    'blocked': (lambda cell_data: "🚫 Blocked", _FG_BLOCKED),
+}
+
+# orjson is optional; it's a faster drop-in for encoding the data files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Set CALPRO_PRETTY_JSON=1 to write indented, human-readable data files
+PRETTY_JSON = os.environ.get('CALPRO_PRETTY_JSON') == '1'
 
 # Configure the appearance mode and default color theme
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
 
 
+# PyInstaller creates a temp folder and stores path in _MEIPASS
+_RESOURCE_BASE = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
+
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller."""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
+    return os.path.join(_RESOURCE_BASE, relative_path)
 
-    return os.path.join(base_path, relative_path)
 
+# Decoded PIL images keyed by (filename, size), shared by every icon user
+_PIL_CACHE = {}
 
-def load_storage_settings():
-    """Load storage location settings from config file."""
-    # Default location to OneDrive folder
-    default_location = r"C:\Users\umfhe\OneDrive - Middlesex University\A - Calendar Pro"
 
-    # Create the default directory if it doesn't exist
-    if not os.path.exists(default_location):
+def load_pil_image(filename, size=None):
+    """Opens a bundled image once (optionally resized) and caches it."""
+    key = (filename, size)
+    pil_img = _PIL_CACHE.get(key)
+    if pil_img is None:
+        pil_img = Image.open(resource_path(filename))
+        if size is not None:
+            # Only small window icons are resized here; bilinear is plenty
+            pil_img = pil_img.resize(size, Image.Resampling.BILINEAR)
+        _PIL_CACHE[key] = pil_img
+    return pil_img
+
+
+# Storage location for this session, read from disk on first use
+_storage_location = None
+
+# Default storage folder, created (or replaced by the cwd) once per process
+_default_storage_location = None
+
+
+def default_storage_location():
+    """Returns the default OneDrive storage folder, creating it on first use."""
+    global _default_storage_location
+    if _default_storage_location is None:
+        default_location = r"C:\Users\umfhe\OneDrive - Middlesex University\A - Calendar Pro"
+
+        # Create the default directory if it doesn't exist (no-op when it does)
         try:
             os.makedirs(default_location, exist_ok=True)
-        except:
+        except OSError:
             # If we can't create the OneDrive folder, fall back to current directory
             default_location = os.getcwd()
+        _default_storage_location = default_location
+    return _default_storage_location
+
+
+def load_storage_settings():
+    """Load storage location settings from config file (cached after first read)."""
+    global _storage_location
+    if _storage_location is None:
+        _storage_location = _read_storage_settings()
+    return _storage_location
+
+
+def _read_storage_settings():
+    """Reads the storage location from calendar_settings.json."""
+    # Default location to OneDrive folder
+    default_location = default_storage_location()
 
     settings_file = 'calendar_settings.json'
     if os.path.exists(settings_file):
         try:
-            with open(settings_file, 'r') as f:
-                settings = json.load(f)
+            with open(settings_file, 'rb') as f:
+                settings = load_json_bytes(f.read())
                 return settings.get('storage_location', default_location)
         except (json.JSONDecodeError, FileNotFoundError):
             return default_location
@@ -51,14 +164,121 @@ def load_storage_settings():
 
 def save_storage_settings(storage_location):
     """Save storage location settings to config file."""
+    global _storage_location
+    if storage_location == _storage_location:
+        return
     settings = {'storage_location': storage_location}
-    with open('calendar_settings.json', 'w') as f:
-        json.dump(settings, f, indent=4)
+    # Swapped in atomically so a crash can't truncate settings
+    write_file_atomic('calendar_settings.json', dump_json_bytes(settings))
+    _storage_location = storage_location
+
+
+def _new_file_mode():
+    """Returns the mode a plainly created file gets under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def write_file_atomic(path, payload):
+    """Writes bytes to a temp file in the same folder and swaps it in."""
+    f = tempfile.NamedTemporaryFile(
+        'wb', dir=os.path.dirname(path) or '.', suffix='.tmp', delete=False)
+    try:
+        with f:
+            f.write(payload)
+            # Make sure the bytes are on disk before the rename makes them live
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Temp files are created 0600; keep the permissions the file had
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = _new_file_mode()
+        os.chmod(f.name, mode)
+        os.replace(f.name, path)
+    except BaseException:
+        # Don't leave stray temp files in the storage folder
+        try:
+            os.unlink(f.name)
+        except OSError:
+            pass
+        raise
+
+
+def dump_json_bytes(data):
+    """Serializes data to compact JSON bytes (indented if PRETTY_JSON is set)."""
+    if PRETTY_JSON:
+        return json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+    if orjson is not None:
+        # Year and day keys are ints in memory; write them as JSON strings
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    # Emit UTF-8 directly rather than \uXXXX escapes (same bytes as orjson)
+    return json.dumps(data, separators=(',', ':'),
+                      ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=256)
+def _month_grid(year, month):
+    """Returns the day numbers of a month's calendar grid (0 for padding)."""
+    return tuple(_CALENDAR.itermonthdays(year, month))
+
+
+class RecentNote(NamedTuple):
+    """A day with notes shown on the home screen, with its countdown text."""
+    date: str
+    countdown: str
+    days_diff: int
+    note_date: datetime
+    notes: list
+    year: int
+    month: str
+    day: int
+
+
+def load_json_bytes(data):
+    """Parses JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _note_ordinal(year, month_name, day):
+    """Returns the date ordinal for a note's keys, or None if they are invalid."""
+    try:
+        return datetime(year, _MONTH_NUM[month_name], day).toordinal()
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+def _int_key(key):
+    """Converts a numeric JSON object key back to an int."""
+    try:
+        return int(key)
+    except ValueError:
+        return key
+
+
+def _notes_from_json(raw):
+    """Converts loaded notes to in-memory form with int year and day keys."""
+    return {
+        _int_key(year): {
+            month_name: {_int_key(day): notes for day, notes in days.items()}
+            for month_name, days in year_data.items()
+        }
+        for year, year_data in raw.items()
+    }
 
 
 def get_data_file_path(filename):
     """Get the full path for a data file based on storage location setting."""
-    storage_location = load_storage_settings()
+    return _data_file_path(load_storage_settings(), filename)
+
+
+@lru_cache(maxsize=32)
+def _data_file_path(storage_location, filename):
+    """Joins a data file name onto a storage folder (memoized per pair)."""
     return os.path.join(storage_location, filename)
 
 
@@ -77,36 +297,70 @@ class CalendarApp(ctk.CTk):
         self.minsize(800, 700)
 
         # Set app icon with multiple methods for better compatibility
+        self._icon_ready = False
         self.set_window_icon()
 
         # Configure grid weights
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
+        # Today's date, cached and rolled over by a timer at midnight
+        self._today = date.today()
+
         # Initialize storage location
         self.storage_location = load_storage_settings()
 
         # Load existing notes
         self.note_data = self.load_notes()
-        self.timetable_data = self.load_timetable()  # Load timetable data
-        self.modules_data = self.load_modules()  # Load modules data
-
-        # Add preset module if no modules exist
-        if not self.modules_data:
-            self.modules_data = {
-                "CST3510 Memory Analysis": {
-                    "color": "#45B7D1",
-                    "teacher": "Mr David Neilson",
-                    "rooms": ["Room Unknown", "Lab A", "Lab B", "Lecture Hall 1", "Lecture Hall 2"],
-                    "created": datetime.now().isoformat()
-                }
-            }
-            self.save_modules()
+        self.rebuild_note_counts()
+        self.rebuild_notes_index()
+        # Timetable and modules are read when a view first needs them
+        self._timetable_data = None
+        self._modules_data = None
+        self._modules_mtime = None  # modules.json mtime when last read or written
+        self._module_names = None
+        self._timetable_buttons = {}  # Cell key -> button in the shown timetable
 
         self.current_month = None
         self.delete_mode = False
         self.selected_days = set()  # Track selected days for deletion
 
+        # Pending notes.json write, coalesced so bursts of saves hit disk once
+        self._notes_dirty = False
+        self._notes_flush_job = None
+        self._notes_batch_depth = 0
+        self._notes_save_failed = False  # Last scheduled save raised OSError
+
+        # Digest of the last payload written to each data file path
+        self._written_digests = {}
+
+        # Shared fonts and the persistent calendar container (built on first use)
+        self._fonts = {}
+        self._calendar_frame = None
+        self._days_frame = None
+        self._day_cells = []
+        self._day_buttons = {}
+        self._day_indicators = {}
+        self._days_with_notes = set()  # Days with notes in the shown month
+
+        # Persistent notes panel frames and the day they currently show
+        self._notes_panel = ()
+        self._notes_panel_day = None
+
+        # Reused "Notes saved" label and its pending hide, cancelled on navigation
+        self._success_label = None
+        self._success_after_id = None
+
+        # Dialogs built on first use and reused afterwards
+        self._edit_window = None
+        self._confirm_window = None
+
+        # Make sure pending notes are written before the window closes
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Decode the button icons once; every panel rebuild reuses them
+        self.load_icons()
+
         # Create the main layout
         self.create_left_panel()
         self.create_right_panel()
@@ -114,68 +368,95 @@ class CalendarApp(ctk.CTk):
         # Initialize with welcome message and highlight current month
         self.show_months_list()
 
-        # Force icon setting after window is fully initialized
-        self.after(100, self.set_window_icon)
-
-    def set_window_icon(self):
-        """Sets the window icon using multiple fallback methods."""
-        icon_set = False
+        # Keep the cached date and month highlights correct past midnight
+        self.schedule_midnight_refresh()
 
-        # Method 1: Try iconbitmap with .ico file
-        try:
-            self.iconbitmap(resource_path("calendar.ico"))
-            icon_set = True
-        except:
-            pass
+        # Retry icon setting once the window is mapped, if it failed before
+        if not self._icon_ready:
+            self._icon_map_binding = self.bind(
+                "<Map>", self.ensure_window_icon, add="+")
 
-        # Method 1b: Try wm_iconbitmap as alternative
-        try:
-            self.wm_iconbitmap(resource_path("calendar.ico"))
-            icon_set = True
-        except:
-            pass
-
-        # Method 2: Try iconphoto with PNG converted to PhotoImage
-        try:
-            icon_img = tk.PhotoImage(file=resource_path("icon.png"))
-            self.iconphoto(True, icon_img)
-            icon_set = True
-        except:
-            pass
+    def schedule_midnight_refresh(self):
+        """Schedules on_midnight to run just after the date next changes."""
+        now = datetime.now()
+        next_midnight = datetime.combine(now.date() + timedelta(days=1),
+                                         datetime.min.time())
+        delay_ms = int((next_midnight - now).total_seconds() * 1000) + 1000
+        self.after(delay_ms, self.on_midnight)
+
+    def on_midnight(self):
+        """Rolls the cached date over and refreshes the month list."""
+        self._today = date.today()
+        self.refresh_month_notifications()
+        self.schedule_midnight_refresh()
+
+    def load_icons(self):
+        """Loads the PIL icons once into a shared CTkImage cache."""
+        self._icons = {}
+        icon_specs = {
+            'home_37': ("house.ico", 37),
+            'home_48': ("house.ico", 48),
+            'edit_37': ("edit.png", 37),
+            'edit_36': ("edit.png", 36),
+            # One bell image shared by every month's notification badge
+            'bell_42': ("bell.png", 42),
+        }
+        for key, (filename, size) in icon_specs.items():
+            try:
+                pil_img = load_pil_image(filename)
+                self._icons[key] = ctk.CTkImage(
+                    light_image=pil_img, dark_image=pil_img, size=(size, size))
+            except Exception:
+                self._icons[key] = None
 
-        # Method 3: Try using PIL to load and convert the icon
-        try:
-            from PIL import Image, ImageTk
-            # Load icon.png and convert to PhotoImage
-            pil_img = Image.open(resource_path("icon.png"))
-            # Resize to standard icon size if needed
-            pil_img = pil_img.resize((32, 32), Image.Resampling.LANCZOS)
-            tk_img = ImageTk.PhotoImage(pil_img)
-            self.iconphoto(True, tk_img)
-            # Keep reference to prevent garbage collection
-            self._icon_image = tk_img
-            icon_set = True
-        except:
-            pass
+    def set_window_icon(self):
+        """Sets the window icon using the first fallback method that works."""
+        attempts = (self._icon_from_png, self._icon_from_pil_png,
+                    self._icon_from_pil_ico)
+        # .ico bitmaps only work on Windows, where they are the cheapest path
+        if sys.platform == "win32":
+            attempts = (self._icon_from_ico,) + attempts
+        for attempt in attempts:
+            try:
+                attempt()
+            except:
+                continue
+            self._icon_ready = True
+            return
 
-        # Method 4: Try with .ico file converted through PIL
-        try:
-            from PIL import Image, ImageTk
-            pil_img = Image.open(resource_path("calendar.ico"))
-            pil_img = pil_img.resize((32, 32), Image.Resampling.LANCZOS)
-            tk_img = ImageTk.PhotoImage(pil_img)
-            self.iconphoto(True, tk_img)
-            self._icon_image = tk_img
-            icon_set = True
-        except:
-            pass
+    def ensure_window_icon(self, event=None):
+        """Retries the window icon once on first map, then drops the binding."""
+        self.unbind("<Map>", self._icon_map_binding)
+        if not self._icon_ready:
+            self.set_window_icon()
+
+    def _icon_from_ico(self):
+        """Method 1: iconbitmap with the .ico file."""
+        self.iconbitmap(resource_path("calendar.ico"))
+
+    def _icon_from_png(self):
+        """Method 2: iconphoto with the PNG converted to a PhotoImage."""
+        tk_img = tk.PhotoImage(file=resource_path("icon.png"))
+        self.iconphoto(True, tk_img)
+        # Keep reference to prevent garbage collection
+        self._icon_image = tk_img
+
+    def _icon_from_pil_png(self):
+        """Method 3: icon.png loaded through PIL at standard icon size."""
+        tk_img = ImageTk.PhotoImage(load_pil_image("icon.png", (32, 32)))
+        self.iconphoto(True, tk_img)
+        self._icon_image = tk_img
+
+    def _icon_from_pil_ico(self):
+        """Method 4: the .ico file converted through PIL."""
+        tk_img = ImageTk.PhotoImage(load_pil_image("calendar.ico", (32, 32)))
+        self.iconphoto(True, tk_img)
+        self._icon_image = tk_img
 
     def create_left_panel(self):
         """Creates the left panel with month list and note counters."""
         # Left Frame for Months
         self.left_frame = ctk.CTkFrame(self, width=250, corner_radius=15)
-        self.left_frame.grid(
-            row=0, column=0, sticky="nsew", padx=(10, 5), pady=10)
         self.left_frame.grid_propagate(False)
         self.left_frame.configure(width=250)
 
@@ -190,16 +471,8 @@ class CalendarApp(ctk.CTk):
         home_btn_frame.grid(row=0, column=0, padx=15,
                             pady=(10, 5), sticky="ew")
 
-        # Load home icon
-        home_icon = None
-        try:
-            home_icon = ctk.CTkImage(
-                light_image=Image.open(resource_path("house.ico")),
-                dark_image=Image.open(resource_path("house.ico")),
-                size=(37, 37)
-            )
-        except:
-            pass
+        # Home icon from the shared cache
+        home_icon = self._icons['home_37']
 
         home_btn = ctk.CTkButton(
             home_btn_frame,
@@ -207,10 +480,10 @@ class CalendarApp(ctk.CTk):
             image=home_icon,
             compound="left",
             command=self.show_months_list,
-            fg_color=("#0B2027", "#0B2027"),
-            hover_color=("#1A3A47", "#1A3A47"),
-            text_color=("white", "white"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            fg_color=_FG_HIGHLIGHT,
+            hover_color=_HOV_HIGHLIGHT,
+            text_color=_TXT_WHITE,
+            font=self.font(14, "bold"),
             corner_radius=10,
             height=40,
             width=220
@@ -224,15 +497,7 @@ class CalendarApp(ctk.CTk):
             row=1, column=0, padx=15, pady=(5, 5), sticky="ew")
 
         # Load time table icon (using edit icon as placeholder)
-        timetable_icon = None
-        try:
-            timetable_icon = ctk.CTkImage(
-                light_image=Image.open(resource_path("edit.png")),
-                dark_image=Image.open(resource_path("edit.png")),
-                size=(37, 37)
-            )
-        except:
-            pass
+        timetable_icon = self._icons['edit_37']
 
         timetable_btn = ctk.CTkButton(
             timetable_btn_frame,
@@ -240,10 +505,10 @@ class CalendarApp(ctk.CTk):
             image=timetable_icon,
             compound="left",
             command=self.show_timetable,
-            fg_color=("#482728", "#482728"),
-            hover_color=("#5A3233", "#5A3233"),
-            text_color=("white", "white"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            fg_color=_FG_ACCENT,
+            hover_color=_HOV_ACCENT,
+            text_color=_TXT_WHITE,
+            font=self.font(14, "bold"),
             corner_radius=10,
             height=40,
             width=220
@@ -257,15 +522,7 @@ class CalendarApp(ctk.CTk):
             row=2, column=0, padx=15, pady=(5, 5), sticky="ew")
 
         # Load settings icon (using edit icon as placeholder)
-        settings_icon = None
-        try:
-            settings_icon = ctk.CTkImage(
-                light_image=Image.open(resource_path("edit.png")),
-                dark_image=Image.open(resource_path("edit.png")),
-                size=(37, 37)
-            )
-        except:
-            pass
+        settings_icon = self._icons['edit_37']
 
         settings_btn = ctk.CTkButton(
             settings_btn_frame,
@@ -275,8 +532,8 @@ class CalendarApp(ctk.CTk):
             command=self.show_settings,
             fg_color=("#2E4057", "#2E4057"),
             hover_color=("#3A506B", "#3A506B"),
-            text_color=("white", "white"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color=_TXT_WHITE,
+            font=self.font(14, "bold"),
             corner_radius=10,
             height=40,
             width=220
@@ -286,19 +543,29 @@ class CalendarApp(ctk.CTk):
         # Month buttons container
         self.month_buttons = {}
         self.month_note_labels = {}
+        self._pending_notifications = set()
+        self._rendered_counts = {}  # Count each month's badge currently shows
         self.create_month_list()
 
+        # Grid the panel only once all its children exist (one layout pass)
+        self.left_frame.grid(
+            row=0, column=0, sticky="nsew", padx=(10, 5), pady=10)
+
+    def month_button_style(self, is_current_month):
+        """Returns the colour options for a month button."""
+        return _MONTH_STYLE_CURRENT if is_current_month else _MONTH_STYLE_REGULAR
+
     def create_month_list(self):
         """Populates the left frame with buttons for each month of the year."""
-        current_year = datetime.now().year
-        current_month = datetime.now().month
+        today = self._today
+        current_year, current_month = today.year, today.month
+        self._highlighted_month = current_month
+        pending_badges = []
 
         for i in range(1, 13):
-            month_name = calendar.month_name[i]
-            month_data = self.note_data.get(
-                str(current_year), {}).get(month_name, {})
-            note_count = len(
-                [day for day, notes in month_data.items() if notes])
+            month_name = _MONTH_NAMES[i]
+            note_count = self.month_note_counts.get(
+                (current_year, month_name), 0)
             is_current_month = (i == current_month)
 
             # Create button container with rounded corners (adjust row to i+2 for timetable and settings buttons)
@@ -308,75 +575,41 @@ class CalendarApp(ctk.CTk):
 
             # Month button with current month highlighting
             notification_text = f"{i} {month_name}"
-            notification_fg_color = (
-                "#0B2027", "#0B2027") if is_current_month else ("gray90", "gray10")
-            notification_hover_color = (
-                "#1A3A47", "#1A3A47") if is_current_month else ("gray85", "gray15")
 
             month_btn = ctk.CTkButton(
                 btn_container,
                 text=notification_text,
-                command=lambda month_num=i: self.show_calendar(month_num),
+                command=partial(self.show_calendar, i),
                 anchor="w",
-                fg_color=notification_fg_color,
-                hover_color=notification_hover_color,
-                text_color=("white", "white") if is_current_month else (
-                    "gray20", "gray80"),
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self.font(14, "bold"),
                 corner_radius=10,
                 height=40,
-                width=220
+                width=220,
+                **self.month_button_style(is_current_month)
             )
             month_btn.pack(side="left", padx=5, pady=5, fill="x", expand=True)
 
-            # Add notification icon outside the button container if there are notes
-            if note_count > 0:
-                # Create notification frame outside the button container
-                notification_frame = ctk.CTkFrame(
-                    self.left_frame, fg_color="transparent")
-                notification_frame.grid(
-                    row=i+2, column=1, padx=(5, 15), pady=2, sticky="ne")
-
-                # Try using Canvas to overlay text on image without background
-                import tkinter as tk
-                canvas = tk.Canvas(
-                    notification_frame,
-                    width=42,
-                    height=42,
-                    highlightthickness=0,
-                    bg='#dbdbdb'  # Use the exact background color you mentioned
-                )
-                canvas.pack()
-
-                # Load and draw the icon image on canvas
-                try:
-                    from PIL import ImageTk
-                    icon_pil = Image.open(resource_path(
-                        "bell.png")).resize((42, 42))
-                    icon_photo = ImageTk.PhotoImage(icon_pil)
-                    canvas.create_image(21, 21, image=icon_photo)
-                    # Keep a reference to prevent garbage collection
-                    canvas.image = icon_photo
-
-                    # Draw text with black color (no background circle)
-                    canvas.create_text(21, 21, text=str(note_count),
-                                       font=("Arial", 14, "bold"),
-                                       fill="black")
-                except Exception as e:
-                    # Fallback to simple colored circle with text
-                    canvas.create_oval(
-                        5, 5, 37, 37, fill="red", outline="white", width=2)
-                    canvas.create_text(21, 21, text=str(note_count),
-                                       font=("Arial", 16, "bold"),
-                                       fill="white")
-
             self.month_buttons[month_name] = month_btn
-            # Store notification counter for updates
+            # Badges are filled in after the first paint
+            self.month_note_labels[month_name] = None
             if note_count > 0:
-                # Store canvas instead
-                self.month_note_labels[month_name] = canvas
-            else:
-                self.month_note_labels[month_name] = None
+                pending_badges.append(month_name)
+
+        self._pending_badges = pending_badges
+        if pending_badges:
+            self.after_idle(self.build_next_badge)
+
+    def build_next_badge(self):
+        """Creates one deferred month badge, yielding to Tk between badges."""
+        if not self._pending_badges:
+            return
+        month_name = self._pending_badges.pop(0)
+        # Use the live count in case notes changed since the list was built
+        note_count = self.month_note_counts.get(
+            (self._today.year, month_name), 0)
+        self.update_month_notification(month_name, note_count)
+        if self._pending_badges:
+            self.after_idle(self.build_next_badge)
 
     def create_right_panel(self):
         """Creates the right panel for calendar display."""
@@ -388,15 +621,27 @@ class CalendarApp(ctk.CTk):
 
     def clear_right_frame(self):
         """Destroys all widgets in the right frame to prepare for new content."""
+        # The success label is kept but hidden, so drop its timer
+        self.cancel_success_message()
+
+        # The calendar and notes panels are kept; only unmap them
+        self._day_buttons = {}
+
         for widget in self.right_frame.winfo_children():
-            widget.destroy()
+            if widget is self._calendar_frame or widget in self._notes_panel:
+                widget.grid_forget()
+            elif widget is self._success_label:
+                widget.place_forget()
+            else:
+                widget.destroy()
 
     def show_calendar(self, month_num):
         """Displays a calendar for a selected month and allows adding notes."""
         self.clear_right_frame()
         self.current_month = month_num
-        current_year = datetime.now().year
-        month_name = calendar.month_name[month_num]
+        today = self._today
+        current_year, current_month, current_day = today.year, today.month, today.day
+        month_name = _MONTH_NAMES[month_num]
 
         # Configure right frame grid
         self.right_frame.grid_columnconfigure(0, weight=1)
@@ -413,8 +658,8 @@ class CalendarApp(ctk.CTk):
             text="← Back to Months",
             command=self.show_months_list,
             fg_color="transparent",
-            text_color=("#0B2027", "#0B2027"),
-            font=ctk.CTkFont(size=12),
+            text_color=_FG_HIGHLIGHT,
+            font=self.font(12),
             corner_radius=8,
             height=30
         )
@@ -426,9 +671,9 @@ class CalendarApp(ctk.CTk):
                 header_frame,
                 text="🗑️ Delete Notes",
                 command=self.enter_delete_mode,
-                fg_color=("red", "darkred"),
-                hover_color=("darkred", "red"),
-                font=ctk.CTkFont(size=12),
+                fg_color=_FG_DANGER,
+                hover_color=_HOV_DANGER,
+                font=self.font(12),
                 corner_radius=8,
                 height=30
             )
@@ -443,22 +688,24 @@ class CalendarApp(ctk.CTk):
                 delete_controls,
                 text=f"✓ Delete {len(self.selected_days)} Days",
                 command=self.confirm_delete_selected,
-                fg_color=("red", "darkred"),
-                hover_color=("darkred", "red"),
-                font=ctk.CTkFont(size=11),
+                fg_color=_FG_DANGER,
+                hover_color=_HOV_DANGER,
+                font=self.font(11),
                 corner_radius=8,
                 height=30,
                 width=120
             )
             confirm_btn.pack(side="left", padx=(0, 5))
+            # Kept so toggling a day can update the count in place
+            self._confirm_btn = confirm_btn
 
             cancel_btn = ctk.CTkButton(
                 delete_controls,
                 text="✕ Cancel",
                 command=self.exit_delete_mode,
-                fg_color=("gray", "darkgray"),
-                hover_color=("darkgray", "gray"),
-                font=ctk.CTkFont(size=11),
+                fg_color=_FG_CANCEL,
+                hover_color=_HOV_CANCEL,
+                font=self.font(11),
                 corner_radius=8,
                 height=30,
                 width=60
@@ -469,145 +716,192 @@ class CalendarApp(ctk.CTk):
             header_frame,
             text=f"{month_name} ({current_year})" +
             (" - Select days to delete" if self.delete_mode else ""),
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=self.font(28, "bold")
         )
         title_label.grid(row=0, column=2, sticky="w")
 
-        # Calendar container
-        calendar_frame = ctk.CTkFrame(self.right_frame, corner_radius=15)
+        # Calendar container (kept between renders with its weekday header and day cells)
+        calendar_frame = self.get_calendar_frame()
         calendar_frame.grid(row=1, column=0, padx=20,
                             pady=(0, 20), sticky="nsew")
+
+        # Populate calendar days by reconfiguring the persistent 6x7 cells
+        self._day_buttons = {}
+        is_current_month_view = (month_num == current_month)
+        month_data = self.note_data.get(current_year, {}).get(month_name, {})
+        # Kept for delete-mode clicks, which only select days with notes
+        days_with_notes = self._days_with_notes = {
+            day for day, notes in month_data.items() if notes}
+        month_grid = _month_grid(current_year, month_num)
+
+        for index, day_btn in enumerate(self._day_cells):
+            row, col = divmod(index, 7)
+            day = month_grid[index] if index < len(month_grid) else 0
+            if day == 0:
+                # Days outside the month are left as empty grid cells
+                day_btn.grid_remove()
+                self.set_day_indicators(row, col, False, False, False)
+                continue
+
+            # Check if there are notes for this day
+            has_notes = day in days_with_notes
+
+            # Check if this is the current day (only highlight if viewing current month)
+            is_current_day = (is_current_month_view and day == current_day)
+
+            # Check if this day is selected for deletion
+            is_selected = self.delete_mode and day in self.selected_days
+
+            # Point the cell at this day (clicks go through one dispatcher)
+            day_btn.configure(
+                text=str(day),
+                command=partial(self.handle_day_click,
+                                current_year, month_name, day),
+                **self.day_button_style(has_notes, is_current_day, is_selected)
+            )
+            day_btn.grid()  # Restores the remembered grid options
+            # Keep the cell's position so recolours skip a grid_info() query
+            self._day_buttons[day] = (day_btn, row, col)
+
+            self.set_day_indicators(
+                row, col, has_notes, is_current_day, is_selected)
+
+    def get_calendar_frame(self):
+        """Returns the calendar container, building it and its weekday header once."""
+        if self._calendar_frame is not None:
+            return self._calendar_frame
+
+        calendar_frame = ctk.CTkFrame(self.right_frame, corner_radius=15)
         calendar_frame.grid_columnconfigure(0, weight=1)
         calendar_frame.grid_rowconfigure(1, weight=1)
 
         # Weekdays header
         weekdays_frame = ctk.CTkFrame(calendar_frame, fg_color="transparent")
-        weekdays_frame.grid(row=0, column=0, padx=20,
-                            pady=(20, 10), sticky="ew")
 
         weekdays = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
         for col, day in enumerate(weekdays):
             weekday_label = ctk.CTkLabel(
                 weekdays_frame,
                 text=day,
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=("gray30", "gray70")
+                font=self.font(14, "bold"),
+                text_color=_TXT_SUBTLE
             )
             weekday_label.grid(row=0, column=col, padx=5, pady=5, sticky="ew")
             weekdays_frame.grid_columnconfigure(col, weight=1)
+        weekdays_frame.grid(row=0, column=0, padx=20,
+                            pady=(20, 10), sticky="ew")
 
-        # Days grid
+        # Days grid (uniform so empty cells keep their size)
         days_frame = ctk.CTkFrame(calendar_frame, fg_color="transparent")
-        days_frame.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
-
-        # Configure days frame grid
         for i in range(7):
-            days_frame.grid_columnconfigure(i, weight=1)
+            days_frame.grid_columnconfigure(i, weight=1, uniform="day")
         for i in range(6):
-            days_frame.grid_rowconfigure(i, weight=1)
-
-        cal = calendar.Calendar()
+            days_frame.grid_rowconfigure(i, weight=1, uniform="day")
 
-        # Populate calendar days
-        row, col = 0, 0
-        current_day = datetime.now().day
-        current_month = datetime.now().month
-        is_current_month_view = (month_num == current_month)
-
-        for day in cal.itermonthdays(current_year, month_num):
-            if day == 0:
-                # Empty cell for days outside the month
-                empty_label = ctk.CTkLabel(
-                    days_frame, text="", fg_color="transparent")
-                empty_label.grid(row=row, column=col, padx=2,
-                                 pady=2, sticky="nsew")
-                col = (col + 1) % 7
-                if col == 0:
-                    row += 1
-                continue
-
-            # Check if there are notes for this day
-            day_notes = self.note_data.get(str(current_year), {}).get(
-                month_name, {}).get(str(day), [])
-            has_notes = len(day_notes) > 0
-
-            # Check if this is the current day (only highlight if viewing current month)
-            is_current_day = (is_current_month_view and day == current_day)
-
-            # Check if this day is selected for deletion
-            is_selected = day in self.selected_days
-
-            # Determine button colors based on notes, current day, and selection
-            if self.delete_mode and is_selected:
-                # Selected for deletion
-                fg_color = ("orange", "darkorange")
-                hover_color = ("darkorange", "orange")
-                text_color = ("white", "white")
-            elif is_current_day:
-                # Current day gets the new color highlight
-                fg_color = ("#0B2027", "#0B2027")
-                hover_color = ("#1A3A47", "#1A3A47")
-                text_color = ("white", "white")
-            elif has_notes:
-                # Days with notes get the new color highlight
-                fg_color = ("#6DB176", "#6DB176")
-                hover_color = ("#83CC8D", "#83CC8D")
-                text_color = ("white", "white")
-            else:
-                # Regular days
-                fg_color = ("gray95", "gray5")
-                hover_color = ("gray90", "gray10")
-                text_color = ("gray20", "gray80")
-
-            # Create day button with appropriate command
-            if self.delete_mode:
-                def command(d=day): return self.toggle_day_selection(
-                    d, current_year, month_name)
-            else:
-                def command(d=day): return self.show_notes_panel(
-                    current_year, month_name, d)
-
-            # Create day button
+        # One button per cell, reconfigured for each month that is shown
+        for index in range(42):
+            row, col = divmod(index, 7)
             day_btn = ctk.CTkButton(
                 days_frame,
-                text=str(day),
-                command=command,
+                text="",
                 width=60,
                 height=60,
                 corner_radius=12,
-                fg_color=fg_color,
-                hover_color=hover_color,
-                font=ctk.CTkFont(size=16, weight="bold"),
-                text_color=text_color
+                font=self.font(16, "bold"),
+                **_DAY_STYLE_REGULAR
             )
             day_btn.grid(row=row, column=col, padx=2, pady=2, sticky="nsew")
+            self._day_cells.append(day_btn)
+        days_frame.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
+
+        self._days_frame = days_frame
+        self._calendar_frame = calendar_frame
+        return calendar_frame
+
+    def font(self, size, weight="normal"):
+        """Returns a shared CTkFont for the given size and weight."""
+        key = (size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(size=size, weight=weight)
+        return font
+
+    def day_button_style(self, has_notes, is_current_day, is_selected):
+        """Returns the colour options for a calendar day button."""
+        if is_selected:
+            # Selected for deletion
+            return _DAY_STYLE_SELECTED
+        if is_current_day:
+            # Current day gets the new color highlight
+            return _DAY_STYLE_TODAY
+        if has_notes:
+            # Days with notes get the new color highlight
+            return _DAY_STYLE_NOTES
+        # Regular days
+        return _DAY_STYLE_REGULAR
+
+    def set_day_indicators(self, row, col, has_notes, is_current_day, is_selected):
+        """Shows or hides the note and selection markers on a day cell."""
+        indicators = self._day_indicators.setdefault((row, col), {})
+        wanted = {
+            # Note indicator if there are notes (but not if it's the current day or selected)
+            'note': has_notes and not is_current_day and not is_selected,
+            # Selection indicator if in delete mode and selected
+            'check': is_selected,
+        }
+
+        for kind, visible in wanted.items():
+            indicator = indicators.get(kind)
+            if not visible:
+                if indicator is not None:
+                    indicator.grid_remove()
+                continue
+            if indicator is not None:
+                indicator.grid()  # Restores the remembered grid options
+                continue
 
-            # Add note indicator if there are notes (but not if it's the current day or selected)
-            if has_notes and not is_current_day and not (self.delete_mode and is_selected):
-                note_indicator = ctk.CTkLabel(
-                    days_frame,
-                    text=f"📝",
-                    font=ctk.CTkFont(size=10),
+            if kind == 'note':
+                indicator = ctk.CTkLabel(
+                    self._days_frame,
+                    text="📝",
+                    font=self.font(10),
                     fg_color="transparent"
                 )
-                note_indicator.grid(row=row, column=col, padx=(
+                indicator.grid(row=row, column=col, padx=(
                     40, 0), pady=(0, 20), sticky="ne")
-
-            # Add selection indicator if in delete mode and selected
-            if self.delete_mode and is_selected:
-                selection_indicator = ctk.CTkLabel(
-                    days_frame,
+            else:
+                indicator = ctk.CTkLabel(
+                    self._days_frame,
                     text="✓",
-                    font=ctk.CTkFont(size=14, weight="bold"),
-                    text_color=("white", "white"),
+                    font=self.font(14, "bold"),
+                    text_color=_TXT_WHITE,
                     fg_color="transparent"
                 )
-                selection_indicator.grid(row=row, column=col, padx=(
+                indicator.grid(row=row, column=col, padx=(
                     40, 0), pady=(5, 0), sticky="ne")
-
-            col = (col + 1) % 7
-            if col == 0:
-                row += 1
+            indicators[kind] = indicator
+
+    def refresh_day_cell(self, day, year, month_name):
+        """Recolours a single day button without rebuilding the calendar."""
+        today = self._today
+        has_notes = bool(self.note_data.get(year, {}).get(
+            month_name, {}).get(day))
+        is_current_day = (
+            _MONTH_NUM[month_name] == today.month and day == today.day)
+        is_selected = self.delete_mode and day in self.selected_days
+
+        day_btn, row, col = self._day_buttons[day]
+        day_btn.configure(
+            **self.day_button_style(has_notes, is_current_day, is_selected))
+        self.set_day_indicators(row, col, has_notes, is_current_day,
+                                is_selected)
+
+    def handle_day_click(self, year, month_name, day):
+        """Opens a day's notes, or toggles its selection in delete mode."""
+        if self.delete_mode:
+            self.toggle_day_selection(day, year, month_name)
+        else:
+            self.show_notes_panel(year, month_name, day)
 
     def show_months_list(self):
         """Shows the months list on the left panel."""
@@ -630,16 +924,8 @@ class CalendarApp(ctk.CTk):
             welcome_frame, fg_color="transparent")
         welcome_header_frame.pack(pady=(30, 10))
 
-        # Load home icon for welcome screen
-        home_icon_welcome = None
-        try:
-            home_icon_welcome = ctk.CTkImage(
-                light_image=Image.open(resource_path("house.ico")),
-                dark_image=Image.open(resource_path("house.ico")),
-                size=(48, 48)
-            )
-        except:
-            pass
+        # Home icon for welcome screen (shared cache)
+        home_icon_welcome = self._icons['home_48']
 
         if home_icon_welcome:
             home_icon_label = ctk.CTkLabel(
@@ -653,7 +939,7 @@ class CalendarApp(ctk.CTk):
         welcome_label = ctk.CTkLabel(
             welcome_header_frame,
             text="Welcome to Calendar Pro!",
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=self.font(28, "bold")
         )
         welcome_label.pack(side="left")
 
@@ -661,7 +947,7 @@ class CalendarApp(ctk.CTk):
         date_time_label = ctk.CTkLabel(
             welcome_frame,
             text=f"{current_date}\n🕐 {current_time}",
-            font=ctk.CTkFont(size=32, weight="bold"),
+            font=self.font(32, "bold"),
             text_color=("black", "black")
         )
         date_time_label.pack(pady=(40, 20))
@@ -669,14 +955,14 @@ class CalendarApp(ctk.CTk):
         instruction_label = ctk.CTkLabel(
             welcome_frame,
             text="Select a month from the left panel to view the calendar and add notes.",
-            font=ctk.CTkFont(size=16),
-            text_color=("gray40", "gray60")
+            font=self.font(16),
+            text_color=_TXT_MUTED
         )
         instruction_label.pack(pady=(0, 20))
 
         # Recent notes panel with background container
         recent_notes_container = ctk.CTkFrame(
-            welcome_frame, corner_radius=15, fg_color=("gray95", "gray10"))
+            welcome_frame, corner_radius=15, fg_color=_FG_PANEL)
         recent_notes_container.pack(fill="x", padx=20, pady=10)
 
         recent_notes_frame = ctk.CTkFrame(
@@ -686,8 +972,8 @@ class CalendarApp(ctk.CTk):
         recent_title = ctk.CTkLabel(
             recent_notes_frame,
             text="Recent Notes",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=("#0B2027", "#0B2027")
+            font=self.font(20, "bold"),
+            text_color=_FG_HIGHLIGHT
         )
         recent_title.pack(pady=(0, 15))
 
@@ -706,9 +992,9 @@ class CalendarApp(ctk.CTk):
 
                 date_label = ctk.CTkLabel(
                     header_frame,
-                    text=f"• {note_info['date']} - {note_info['countdown']}",
-                    font=ctk.CTkFont(size=16, weight="bold"),
-                    text_color=("#0B2027", "#0B2027"),
+                    text=f"• {note_info.date} - {note_info.countdown}",
+                    font=self.font(16, "bold"),
+                    text_color=_FG_HIGHLIGHT,
                     anchor="w"
                 )
                 date_label.pack(side="left", anchor="w")
@@ -718,26 +1004,18 @@ class CalendarApp(ctk.CTk):
                 btn_frame.pack(side="right", padx=(10, 0))
 
                 # Edit button (opens editable window)
-                # Load edit icon
-                edit_icon = None
-                try:
-                    edit_icon = ctk.CTkImage(
-                        light_image=Image.open(resource_path("edit.png")),
-                        dark_image=Image.open(resource_path("edit.png")),
-                        size=(36, 36)
-                    )
-                except:
-                    pass
+                # Edit icon from the shared cache
+                edit_icon = self._icons['edit_36']
 
                 edit_btn = ctk.CTkButton(
                     btn_frame,
                     text="Edit" if not edit_icon else "",
                     image=edit_icon,
                     compound="left",
-                    command=lambda n=note_info: self.edit_note_in_window(n),
+                    command=partial(self.edit_note_in_window, note_info),
                     fg_color="transparent",
-                    text_color=("#0B2027", "#0B2027"),
-                    font=ctk.CTkFont(size=13, weight="bold"),
+                    text_color=_FG_HIGHLIGHT,
+                    font=self.font(13, "bold"),
                     corner_radius=8,
                     height=25,
                     width=70
@@ -745,17 +1023,17 @@ class CalendarApp(ctk.CTk):
                 edit_btn.pack(side="left")
 
                 # Note content display
-                if note_info['notes']:
+                if note_info.notes:
                     # Show first line with preview
-                    first_line = note_info['notes'][0]
+                    first_line = note_info.notes[0]
                     preview_text = first_line[:50] + \
                         "..." if len(first_line) > 50 else first_line
 
                     note_preview = ctk.CTkLabel(
                         note_frame,
                         text=f"{preview_text}",
-                        font=ctk.CTkFont(size=15),
-                        text_color=("gray20", "gray80"),
+                        font=self.font(15),
+                        text_color=_TXT_DIM,
                         anchor="w",
                         justify="left"
                     )
@@ -764,7 +1042,7 @@ class CalendarApp(ctk.CTk):
                     no_content_label = ctk.CTkLabel(
                         note_frame,
                         text="> No note content",
-                        font=ctk.CTkFont(size=15),
+                        font=self.font(15),
                         text_color=("gray50", "gray70"),
                         anchor="w"
                     )
@@ -773,7 +1051,7 @@ class CalendarApp(ctk.CTk):
             no_notes_label = ctk.CTkLabel(
                 recent_notes_frame,
                 text="No recent notes found",
-                font=ctk.CTkFont(size=14),
+                font=self.font(14),
                 text_color=("gray50", "gray60")
             )
             no_notes_label.pack(pady=10)
@@ -788,9 +1066,29 @@ class CalendarApp(ctk.CTk):
         self.right_frame.grid_columnconfigure(0, weight=1)
         self.right_frame.grid_rowconfigure(1, weight=1)
 
+        # The panel is built once; only its title and text change per day
+        if not self._notes_panel:
+            self.build_notes_panel()
+        header_frame, notes_container, btn_frame = self._notes_panel
+        self._notes_panel_day = (year, month_name, day)
+        self._notes_title.configure(text=f"Notes for {month_name} {day}, {year}")
+
+        # Load existing notes
+        self.notes_text.delete("1.0", "end")
+        notes = self.note_data.get(year, {}).get(
+            month_name, {}).get(day, [])
+        if notes:
+            self.notes_text.insert("1.0", "\n".join(notes))
+
+        header_frame.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="ew")
+        notes_container.grid(row=1, column=0, padx=20,
+                             pady=(0, 20), sticky="nsew")
+        btn_frame.grid(row=2, column=0, pady=10)
+
+    def build_notes_panel(self):
+        """Creates the notes panel widgets that show_notes_panel reuses."""
         # Header
         header_frame = ctk.CTkFrame(self.right_frame, fg_color="transparent")
-        header_frame.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="ew")
         header_frame.grid_columnconfigure(1, weight=1)
 
         back_btn = ctk.CTkButton(
@@ -798,24 +1096,22 @@ class CalendarApp(ctk.CTk):
             text="← Back to Calendar",
             command=lambda: self.show_calendar(self.current_month),
             fg_color="transparent",
-            text_color=("#0B2027", "#0B2027"),
-            font=ctk.CTkFont(size=12),
+            text_color=_FG_HIGHLIGHT,
+            font=self.font(12),
             corner_radius=8,
             height=30
         )
         back_btn.grid(row=0, column=0, padx=(0, 10))
 
-        notes_title = ctk.CTkLabel(
+        self._notes_title = ctk.CTkLabel(
             header_frame,
-            text=f"Notes for {month_name} {day}, {year}",
-            font=ctk.CTkFont(size=24, weight="bold")
+            text="",
+            font=self.font(24, "bold")
         )
-        notes_title.grid(row=0, column=1, sticky="w")
+        self._notes_title.grid(row=0, column=1, sticky="w")
 
         # Notes container
         notes_container = ctk.CTkFrame(self.right_frame, corner_radius=15)
-        notes_container.grid(row=1, column=0, padx=20,
-                             pady=(0, 20), sticky="nsew")
         notes_container.grid_columnconfigure(0, weight=1)
         notes_container.grid_rowconfigure(0, weight=1)
 
@@ -823,31 +1119,24 @@ class CalendarApp(ctk.CTk):
         self.notes_text = ctk.CTkTextbox(
             notes_container,
             wrap="word",
-            font=ctk.CTkFont(size=14),
+            font=self.font(14),
             corner_radius=10
         )
         self.notes_text.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
 
-        # Load existing notes
-        notes = self.note_data.get(str(year), {}).get(
-            month_name, {}).get(str(day), [])
-        if notes:
-            self.notes_text.insert("1.0", "\n".join(notes))
-
         # Button frame
         btn_frame = ctk.CTkFrame(self.right_frame, fg_color="transparent")
-        btn_frame.grid(row=2, column=0, pady=10)
 
         save_btn = ctk.CTkButton(
             btn_frame,
             text="💾 Save Notes",
             command=lambda: self.save_notes(
-                year, month_name, day, self.notes_text.get("1.0", "end-1c")),
+                *self._notes_panel_day, self.notes_text.get("1.0", "end-1c")),
             corner_radius=10,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("#0B2027", "#0B2027"),
-            hover_color=("#1A3A47", "#1A3A47")
+            font=self.font(14, "bold"),
+            fg_color=_FG_HIGHLIGHT,
+            hover_color=_HOV_HIGHLIGHT
         )
         save_btn.pack(side="left", padx=10)
 
@@ -857,133 +1146,273 @@ class CalendarApp(ctk.CTk):
             command=lambda: self.notes_text.delete("1.0", "end"),
             corner_radius=10,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("red", "darkred"),
-            hover_color=("darkred", "red")
+            font=self.font(14, "bold"),
+            fg_color=_FG_DANGER,
+            hover_color=_HOV_DANGER
         )
         clear_btn.pack(side="left", padx=10)
 
+        self._notes_panel = (header_frame, notes_container, btn_frame)
+
     def save_notes(self, year, month_name, day, notes_text):
         """Saves the notes for a specific day to a JSON file."""
         # Split the text by newlines to store as a list of strings
-        notes_list = [note.strip()
-                      for note in notes_text.split('\n') if note.strip()]
-
-        year_str = str(year)
-        day_str = str(day)
+        notes_list = [note for note in map(str.strip, notes_text.splitlines())
+                      if note]
 
         # Ensure the nested dictionary structure exists
-        if year_str not in self.note_data:
-            self.note_data[year_str] = {}
-        if month_name not in self.note_data[year_str]:
-            self.note_data[year_str][month_name] = {}
+        month_data = self.note_data.setdefault(year, {}).setdefault(month_name, {})
 
-        self.note_data[year_str][month_name][day_str] = notes_list
+        # Nothing to write if the day's notes are unchanged
+        previous_notes = month_data.get(day)
+        if (previous_notes or []) == notes_list:
+            self.show_success_message()
+            return
 
-        # Save to file
-        notes_file_path = get_data_file_path('notes.json')
-        with open(notes_file_path, 'w') as f:
-            json.dump(self.note_data, f, indent=4)
+        # Adjust the cached month count by whether this day gained or lost notes
+        month_data[day] = notes_list
+        self.adjust_month_count(
+            year, month_name, int(bool(notes_list)) - int(bool(previous_notes)))
+        self.index_note_day(year, month_name, day)
+
+        # Save to file (debounced)
+        self.schedule_notes_flush()
 
         # Update the month counter on the left panel
-        note_count = len(
-            [day for day, notes in self.note_data[year_str][month_name].items() if notes])
-        self.update_month_notification(month_name, note_count)
+        self.queue_month_notification(month_name)
 
         # Show success message
         self.show_success_message()
 
+    def schedule_notes_flush(self):
+        """Marks notes as changed and schedules a single write shortly after."""
+        self._notes_dirty = True
+        if self._notes_batch_depth == 0 and self._notes_flush_job is None:
+            self._notes_flush_job = self.after(500, self.run_notes_flush)
+
+    def run_notes_flush(self):
+        """Runs a scheduled notes save, retrying and reporting it if it fails."""
+        self._notes_flush_job = None
+        try:
+            self.flush_notes()
+        except OSError as e:
+            # Notes stay marked dirty; keep trying in the background
+            self._notes_flush_job = self.after(5000, self.run_notes_flush)
+            # There is no console window, so tell the user once per outage
+            if not self._notes_save_failed:
+                self._notes_save_failed = True
+                messagebox.showerror(
+                    "Save Failed",
+                    f"Your notes could not be saved:\n{e}\n\n"
+                    "Calendar Pro will keep retrying in the background.",
+                    parent=self)
+        else:
+            self._notes_save_failed = False
+
+    @contextmanager
+    def batched_writes(self):
+        """Groups several note changes into a single scheduled write."""
+        self._notes_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._notes_batch_depth -= 1
+            if self._notes_batch_depth == 0 and self._notes_dirty:
+                self.schedule_notes_flush()
+
+    def flush_notes(self):
+        """Writes notes.json if there are unsaved changes."""
+        if self._notes_flush_job is not None:
+            self.after_cancel(self._notes_flush_job)
+            self._notes_flush_job = None
+        if not self._notes_dirty:
+            return
+
+        self.write_data_file('notes.json', dump_json_bytes(self.note_data))
+        self._notes_dirty = False
+
+    def write_data_file(self, filename, payload):
+        """Atomically writes a data file, skipping it if the bytes are unchanged."""
+        file_path = get_data_file_path(filename)
+        digest = hashlib.blake2b(payload).digest()
+        if self._written_digests.get(file_path) == digest:
+            return
+        write_file_atomic(file_path, payload)
+        self._written_digests[file_path] = digest
+
+    def on_close(self):
+        """Flushes pending changes and closes the application."""
+        while True:
+            try:
+                self.flush_notes()
+                break
+            except OSError as e:
+                # There is no console window, so report the failed save here
+                retry = messagebox.askretrycancel(
+                    "Save Failed",
+                    f"Your notes could not be saved:\n{e}\n\n"
+                    "Press Retry to try again, or Cancel to quit without saving.",
+                    parent=self)
+                if not retry:
+                    break
+        self.destroy()
+
+    def rebuild_note_counts(self):
+        """Rebuilds the per-(year, month) count of days that have notes."""
+        self.month_note_counts = {
+            (year, month_name): sum(1 for notes in month_data.values() if notes)
+            for year, year_data in self.note_data.items()
+            for month_name, month_data in year_data.items()
+        }
+
+    def rebuild_notes_index(self):
+        """Rebuilds the date-sorted index of days that have notes."""
+        notes_index = []
+        for year, year_data in self.note_data.items():
+            for month_name, month_data in year_data.items():
+                for day, notes in month_data.items():
+                    if not notes:
+                        continue
+                    ordinal = _note_ordinal(year, month_name, day)
+                    if ordinal is not None:
+                        notes_index.append(
+                            (ordinal, year, month_name, day))
+        notes_index.sort()
+        self._notes_index = notes_index
+
+    def index_note_day(self, year, month_name, day):
+        """Adds or removes one day in the notes index to match note_data."""
+        ordinal = _note_ordinal(year, month_name, day)
+        if ordinal is None:
+            return
+        entry = (ordinal, year, month_name, day)
+        position = bisect.bisect_left(self._notes_index, entry)
+        indexed = (position < len(self._notes_index)
+                   and self._notes_index[position] == entry)
+        has_notes = bool(self.note_data.get(year, {}).get(
+            month_name, {}).get(day))
+
+        if has_notes and not indexed:
+            self._notes_index.insert(position, entry)
+        elif indexed and not has_notes:
+            del self._notes_index[position]
+
+    def adjust_month_count(self, year, month_name, delta):
+        """Shifts a month's cached note count by delta and returns the new count."""
+        month_key = (year, month_name)
+        note_count = self.month_note_counts.get(month_key, 0) + delta
+        self.month_note_counts[month_key] = note_count
+        return note_count
+
     def show_success_message(self):
         """Shows a temporary success message."""
-        success_label = ctk.CTkLabel(
-            self.right_frame,
-            text="✅ Notes saved successfully!",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=("#0B2027", "#0B2027")
-        )
-        success_label.place(relx=0.5, rely=0.9, anchor="center")
+        # Restart the timer if a message is already on screen
+        self.cancel_success_message()
+
+        # One label is created on first use and re-placed for every save
+        if self._success_label is None:
+            self._success_label = ctk.CTkLabel(
+                self.right_frame,
+                text="✅ Notes saved successfully!",
+                font=self.font(14, "bold"),
+                text_color=_FG_HIGHLIGHT
+            )
+        self._success_label.place(relx=0.5, rely=0.9, anchor="center")
+        self._success_label.lift()  # Keep it above widgets built since
 
         # Remove the message after 2 seconds
-        self.after(2000, success_label.destroy)
+        self._success_after_id = self.after(2000, self.hide_success_message)
+
+    def hide_success_message(self):
+        """Hides the success message when its timer fires."""
+        self._success_after_id = None
+        if self._success_label is not None:
+            self._success_label.place_forget()
+
+    def cancel_success_message(self):
+        """Cancels the pending success message removal, if any."""
+        if self._success_after_id is not None:
+            self.after_cancel(self._success_after_id)
+            self._success_after_id = None
 
     def load_notes(self):
         """Loads notes from the notes.json file."""
         notes_file_path = get_data_file_path('notes.json')
-        if os.path.exists(notes_file_path):
-            try:
-                with open(notes_file_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return {}
-        return {}
+        try:
+            with open(notes_file_path, 'rb') as f:
+                return _notes_from_json(load_json_bytes(f.read()))
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
 
     def get_recent_notes(self):
         """Gets the 5 most recent notes with countdown to current date."""
-        current_date = datetime.now()
-        all_notes = []
+        # Day differences are plain ordinal subtraction against today
+        today = date.today().toordinal()
+        notes_index = self._notes_index
+
+        def days_from_now(position):
+            return notes_index[position][0] - today
+
+        # Walk outwards from today through the sorted index, taking whichever
+        # neighbour is closer until we have 5 (closest first)
+        newer = bisect.bisect_left(notes_index, (today + 1,))
+        older = newer - 1
+        closest = []
+        while len(closest) < 5 and (older >= 0 or newer < len(notes_index)):
+            if newer < len(notes_index) and (
+                    older < 0 or abs(days_from_now(newer)) < abs(days_from_now(older))):
+                position, newer = newer, newer + 1
+            else:
+                position, older = older, older - 1
+            closest.append(notes_index[position])
+
+        recent_notes = []
+        for ordinal, year, month_name, day in closest:
+            note_date = datetime.fromordinal(ordinal)
+            days_diff = ordinal - today
+            notes = self.note_data[year][month_name][day]
+
+            # Create countdown text
+            if days_diff == 0:
+                countdown = "Today"
+            elif days_diff == 1:
+                countdown = "1 day left"
+            elif days_diff == -1:
+                countdown = "1 day ago"
+            elif days_diff > 1:
+                if days_diff < 7:
+                    countdown = f"{days_diff} days left"
+                else:
+                    weeks = days_diff // 7
+                    remaining_days = days_diff % 7
+                    if remaining_days == 0:
+                        countdown = f"{weeks} week{'s' if weeks > 1 else ''} left"
+                    else:
+                        countdown = f"{weeks} week{'s' if weeks > 1 else ''}, {remaining_days} day{'s' if remaining_days > 1 else ''} left"
+            else:
+                countdown = f"{abs(days_diff)} day{'s' if abs(days_diff) > 1 else ''} ago"
 
-        # Collect all notes with their dates
-        for year_str, year_data in self.note_data.items():
-            for month_name, month_data in year_data.items():
-                for day_str, notes in month_data.items():
-                    if notes:  # Only include days with actual notes
-                        try:
-                            # Create date object for this note
-                            month_num = list(
-                                calendar.month_name).index(month_name)
-                            note_date = datetime(
-                                int(year_str), month_num, int(day_str))
-
-                            # Calculate days difference from current date
-                            days_diff = (note_date - current_date).days
-
-                            # Create countdown text
-                            if days_diff == 0:
-                                countdown = "Today"
-                            elif days_diff == 1:
-                                countdown = "1 day left"
-                            elif days_diff == -1:
-                                countdown = "1 day ago"
-                            elif days_diff > 1:
-                                if days_diff < 7:
-                                    countdown = f"{days_diff} days left"
-                                else:
-                                    weeks = days_diff // 7
-                                    remaining_days = days_diff % 7
-                                    if remaining_days == 0:
-                                        countdown = f"{weeks} week{'s' if weeks > 1 else ''} left"
-                                    else:
-                                        countdown = f"{weeks} week{'s' if weeks > 1 else ''}, {remaining_days} day{'s' if remaining_days > 1 else ''} left"
-                            else:
-                                countdown = f"{abs(days_diff)} day{'s' if abs(days_diff) > 1 else ''} ago"
-
-                            all_notes.append({
-                                'date': f"{month_name} {day_str}, {year_str}",
-                                'countdown': countdown,
-                                'days_diff': days_diff,
-                                'note_date': note_date,
-                                'notes': notes,
-                                'year': year_str,
-                                'month': month_name,
-                                'day': day_str
-                            })
-                        except (ValueError, TypeError):
-                            continue
-
-        # Sort by proximity to current date (closest first)
-        all_notes.sort(key=lambda x: abs(x['days_diff']))
-
-        # Return top 5 most recent
-        return all_notes[:5]
+            recent_notes.append(RecentNote(
+                date=f"{month_name} {day}, {year}",
+                countdown=countdown,
+                days_diff=days_diff,
+                note_date=note_date,
+                notes=notes,
+                year=year,
+                month=month_name,
+                day=day
+            ))
+
+        return recent_notes
 
     def edit_note_from_home(self, note_info):
         """Opens the notes panel for editing a note from the home screen."""
-        year = int(note_info['year'])
-        month_name = note_info['month']
-        day = int(note_info['day'])
+        year = note_info.year
+        month_name = note_info.month
+        day = note_info.day
 
         # Find the month number for the month name
-        month_num = list(calendar.month_name).index(month_name)
+        month_num = _MONTH_NUM[month_name]
 
         # Set current month and show the notes panel
         self.current_month = month_num
@@ -991,16 +1420,40 @@ class CalendarApp(ctk.CTk):
 
     def edit_note_in_window(self, note_info):
         """Opens an editable window for editing a note from the home screen."""
+        # The window is built once and reused (hidden between edits)
+        if self._edit_window is None or not self._edit_window.winfo_exists():
+            self.build_edit_window()
+        note_window = self._edit_window
+
+        note_window.title(f"Edit Note - {note_info.date}")
+        self._edit_title_label.configure(
+            text=f"📝 Edit Note for {note_info.date}")
+
+        # Load the note content
+        note_text = self._edit_note_text
+        note_text.delete("1.0", "end")
+        if note_info.notes:
+            note_text.insert("1.0", "\n".join(note_info.notes))
+
+        self._edit_save_btn.configure(
+            command=lambda: self.save_note_from_window(
+                note_info, note_text.get("1.0", "end-1c")))
+
+        self.show_dialog(note_window)
+
+    def build_edit_window(self):
+        """Creates the hidden note edit window and keeps its widgets."""
         # Create a new window for editing the note
         note_window = ctk.CTkToplevel(self)
-        note_window.title(f"Edit Note - {note_info['date']}")
+        note_window.withdraw()
         note_window.geometry("500x400")
         note_window.resizable(True, True)
 
         # Make window always on top
         note_window.attributes("-topmost", True)
         note_window.transient(self)
-        note_window.grab_set()
+        note_window.protocol(
+            "WM_DELETE_WINDOW", lambda: self.hide_dialog(note_window))
 
         # Configure grid
         note_window.grid_columnconfigure(0, weight=1)
@@ -1009,9 +1462,9 @@ class CalendarApp(ctk.CTk):
         # Title
         title_label = ctk.CTkLabel(
             note_window,
-            text=f"📝 Edit Note for {note_info['date']}",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("#0B2027", "#0B2027")
+            text="",
+            font=self.font(18, "bold"),
+            text_color=_FG_HIGHLIGHT
         )
         title_label.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="w")
 
@@ -1019,30 +1472,24 @@ class CalendarApp(ctk.CTk):
         note_text = ctk.CTkTextbox(
             note_window,
             wrap="word",
-            font=ctk.CTkFont(size=14),
+            font=self.font(14),
             corner_radius=10
         )
         note_text.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
 
-        # Load the note content
-        if note_info['notes']:
-            note_text.insert("1.0", "\n".join(note_info['notes']))
-
         # Button frame
         btn_frame = ctk.CTkFrame(note_window, fg_color="transparent")
         btn_frame.grid(row=2, column=0, pady=(0, 20))
 
-        # Save button
+        # Save button (its command is set for each note being edited)
         save_btn = ctk.CTkButton(
             btn_frame,
             text="💾 Save",
-            command=lambda: self.save_note_from_window(
-                note_info, note_text.get("1.0", "end-1c"), note_window),
             corner_radius=10,
             height=35,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("#0B2027", "#0B2027"),
-            hover_color=("#1A3A47", "#1A3A47")
+            font=self.font(14, "bold"),
+            fg_color=_FG_HIGHLIGHT,
+            hover_color=_HOV_HIGHLIGHT
         )
         save_btn.pack(side="left", padx=10)
 
@@ -1050,84 +1497,151 @@ class CalendarApp(ctk.CTk):
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="❌ Cancel",
-            command=note_window.destroy,
+            command=lambda: self.hide_dialog(note_window),
             corner_radius=10,
             height=35,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color=("gray", "darkgray"),
-            hover_color=("darkgray", "gray")
+            font=self.font(14, "bold"),
+            fg_color=_FG_CANCEL,
+            hover_color=_HOV_CANCEL
         )
         cancel_btn.pack(side="left", padx=10)
 
-    def save_note_from_window(self, note_info, notes_text, window):
+        self._edit_window = note_window
+        self._edit_title_label = title_label
+        self._edit_note_text = note_text
+        self._edit_save_btn = save_btn
+
+    def show_dialog(self, window):
+        """Shows a cached dialog window and makes it modal."""
+        window.deiconify()
+        window.lift()
+        window.grab_set()
+
+    def hide_dialog(self, window):
+        """Hides a cached dialog window so it can be reused."""
+        window.grab_release()
+        window.withdraw()
+
+    def save_note_from_window(self, note_info, notes_text):
         """Saves the note from the edit window and updates the UI."""
         # Split the text by newlines to store as a list of strings
-        notes_list = [note.strip()
-                      for note in notes_text.split('\n') if note.strip()]
+        notes_list = [note for note in map(str.strip, notes_text.splitlines())
+                      if note]
 
-        year = int(note_info['year'])
-        month_name = note_info['month']
-        day = int(note_info['day'])
-        year_str = str(year)
-        day_str = str(day)
+        year = note_info.year
+        month_name = note_info.month
+        day = note_info.day
 
         # Ensure the nested dictionary structure exists
-        if year_str not in self.note_data:
-            self.note_data[year_str] = {}
-        if month_name not in self.note_data[year_str]:
-            self.note_data[year_str][month_name] = {}
+        month_data = self.note_data.setdefault(year, {}).setdefault(month_name, {})
 
-        self.note_data[year_str][month_name][day_str] = notes_list
+        # Only rewrite the file if the day's notes actually changed
+        previous_notes = month_data.get(day)
+        if (previous_notes or []) != notes_list:
+            month_data[day] = notes_list
+            self.adjust_month_count(
+                year, month_name, int(bool(notes_list)) - int(bool(previous_notes)))
+            self.index_note_day(year, month_name, day)
 
-        # Save to file
-        notes_file_path = get_data_file_path('notes.json')
-        with open(notes_file_path, 'w') as f:
-            json.dump(self.note_data, f, indent=4)
+            # Save to file (debounced)
+            self.schedule_notes_flush()
 
-        # Update the month counter on the left panel
-        note_count = len(
-            [day for day, notes in self.note_data[year_str][month_name].items() if notes])
-        self.update_month_notification(month_name, note_count)
+            # Update the month counter on the left panel
+            self.queue_month_notification(month_name)
 
         # Close the window
-        window.destroy()
+        self.hide_dialog(self._edit_window)
 
         # Show success message
         self.show_success_message()
 
+    @property
+    def timetable_data(self):
+        """Timetable cells, loaded from disk on first access."""
+        if self._timetable_data is None:
+            self._timetable_data = self.load_timetable()
+        return self._timetable_data
+
+    @timetable_data.setter
+    def timetable_data(self, value):
+        self._timetable_data = value
+
+    @property
+    def modules_data(self):
+        """Module definitions, loaded from disk on first access."""
+        if self._modules_data is None:
+            self._modules_data = self.load_modules()
+            self._module_names = None
+
+            # Add preset module if no modules exist
+            if not self._modules_data:
+                self._modules_data = {
+                    "CST3510 Memory Analysis": {
+                        "color": "#45B7D1",
+                        "teacher": "Mr David Neilson",
+                        "rooms": ["Room Unknown", "Lab A", "Lab B", "Lecture Hall 1", "Lecture Hall 2"],
+                        "created": datetime.now().isoformat()
+                    }
+                }
+                self.save_modules()
+        return self._modules_data
+
+    @modules_data.setter
+    def modules_data(self, value):
+        self._modules_data = value
+        self._module_names = None
+
+    def module_names(self):
+        """Returns the module names, cached until modules are saved or reloaded."""
+        if self._module_names is None:
+            self._module_names = tuple(self.modules_data)
+        return self._module_names
+
+    def modules_file_changed(self):
+        """Checks whether modules.json changed on disk since it was last read."""
+        try:
+            mtime = os.stat(get_data_file_path('modules.json')).st_mtime_ns
+        except OSError:
+            mtime = None
+        return mtime != self._modules_mtime
+
     def load_timetable(self):
         """Loads timetable data from the timetable.json file."""
         timetable_file_path = get_data_file_path('timetable.json')
-        if os.path.exists(timetable_file_path):
-            try:
-                with open(timetable_file_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return {}
-        return {}
+        try:
+            with open(timetable_file_path, 'rb') as f:
+                return load_json_bytes(f.read())
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
 
     def save_timetable(self):
         """Saves timetable data to timetable.json file."""
-        timetable_file_path = get_data_file_path('timetable.json')
-        with open(timetable_file_path, 'w') as f:
-            json.dump(self.timetable_data, f, indent=4)
+        self.write_data_file(
+            'timetable.json',
+            json.dumps(self.timetable_data, indent=4).encode('utf-8'))
 
     def load_modules(self):
         """Loads modules data from the modules.json file."""
         modules_file_path = get_data_file_path('modules.json')
-        if os.path.exists(modules_file_path):
-            try:
-                with open(modules_file_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return {}
-        return {}
+        try:
+            with open(modules_file_path, 'rb') as f:
+                self._modules_mtime = os.fstat(f.fileno()).st_mtime_ns
+                return load_json_bytes(f.read())
+        except FileNotFoundError:
+            self._modules_mtime = None
+            return {}
+        except json.JSONDecodeError:
+            return {}
 
     def save_modules(self):
         """Saves modules data to modules.json file."""
-        modules_file_path = get_data_file_path('modules.json')
-        with open(modules_file_path, 'w') as f:
-            json.dump(self.modules_data, f, indent=4)
+        self.write_data_file(
+            'modules.json',
+            json.dumps(self.modules_data, indent=4).encode('utf-8'))
+        # Our own write shouldn't make the dropdown think the file changed
+        self._modules_mtime = os.stat(
+            get_data_file_path('modules.json')).st_mtime_ns
+        self._module_names = None
 
     def show_timetable(self):
         """Shows the weekly timetable view."""
@@ -1147,8 +1661,8 @@ class CalendarApp(ctk.CTk):
             text="← Back to Home",
             command=self.show_months_list,
             fg_color="transparent",
-            text_color=("#0B2027", "#0B2027"),
-            font=ctk.CTkFont(size=12),
+            text_color=_FG_HIGHLIGHT,
+            font=self.font(12),
             corner_radius=8,
             height=30
         )
@@ -1157,7 +1671,7 @@ class CalendarApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             header_frame,
             text="📅 Weekly Time Table",
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=self.font(28, "bold")
         )
         title_label.grid(row=0, column=1, sticky="w")
 
@@ -1166,9 +1680,9 @@ class CalendarApp(ctk.CTk):
             header_frame,
             text="📚 Manage Modules",
             command=self.show_modules_manager,
-            fg_color=("#482728", "#482728"),
-            hover_color=("#5A3233", "#5A3233"),
-            font=ctk.CTkFont(size=12),
+            fg_color=_FG_ACCENT,
+            hover_color=_HOV_ACCENT,
+            font=self.font(12),
             corner_radius=8,
             height=30
         )
@@ -1195,19 +1709,8 @@ class CalendarApp(ctk.CTk):
         for i in range(17):  # Header + 16 time slots (6 AM to 10 PM)
             timetable_scroll.grid_rowconfigure(i, weight=1, minsize=35)
 
-        # Time slots (from 6 AM to 10 PM in 12-hour format - hourly intervals)
-        time_slots = []
-        for hour in range(6, 22):  # 6 AM to 10 PM
-            if hour == 12:
-                time_slots.append("12:00 PM")
-            elif hour < 12:
-                time_slots.append(f"{hour}:00 AM")
-            else:
-                display_hour = hour - 12
-                time_slots.append(f"{display_hour}:00 PM")
-
-        days = ["Monday", "Tuesday", "Wednesday",
-                "Thursday", "Friday", "Saturday", "Sunday"]
+        time_slots = _TIME_SLOTS
+        days = _TIMETABLE_DAYS
 
         # Create grid header
         # Empty top-left cell with minimum width for time column
@@ -1222,14 +1725,23 @@ class CalendarApp(ctk.CTk):
             day_label = ctk.CTkLabel(
                 timetable_scroll,
                 text=day,
-                font=ctk.CTkFont(size=12, weight="bold"),
-                fg_color=("#0B2027", "#0B2027"),
-                text_color=("white", "white"),
+                font=self.font(12, "bold"),
+                fg_color=_FG_HIGHLIGHT,
+                text_color=_TXT_WHITE,
                 corner_radius=6,
                 height=35
             )
             day_label.grid(row=0, column=col, padx=1, pady=1, sticky="ew")
 
+        # Lookups shared by every cell, resolved once per render
+        timetable_data = self.timetable_data
+        module_colors = {
+            name: (info.get('color', '#6DB176'),) * 2
+            for name, info in self.modules_data.items()
+        }
+        cell_font = self.font(8)
+        self._timetable_buttons = {}
+
         # Time slot rows
         for row, time_slot in enumerate(time_slots, 1):
             # Time label with bigger font and responsive width
@@ -1237,7 +1749,7 @@ class CalendarApp(ctk.CTk):
                 timetable_scroll,
                 text=time_slot,
                 # Increased from 9 to 12
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=self.font(12, "bold"),
                 fg_color=("gray85", "gray15"),
                 corner_radius=4,
                 height=35  # Increased height to match other cells
@@ -1247,48 +1759,22 @@ class CalendarApp(ctk.CTk):
             # Day cells with responsive width and smaller font
             for col, day in enumerate(days, 1):
                 cell_key = f"{day}_{time_slot}"
-                cell_data = self.timetable_data.get(cell_key, {})
-
-                cell_text = ""
-                cell_color = ("gray95", "gray10")
-                text_color = ("gray40", "gray60")
-
-                if cell_data:
-                    if cell_data.get('type') == 'lesson':
-                        module_name = cell_data.get('module', '')
-                        room = cell_data.get('room', '')
-                        cell_text = f"{module_name}\n{room}" if room else module_name
-
-                        # Use module color if available
-                        if module_name and module_name in self.modules_data:
-                            module_color = self.modules_data[module_name].get(
-                                'color', '#6DB176')
-                            cell_color = (module_color, module_color)
-                        else:
-                            cell_color = ("#6DB176", "#6DB176")
-                        text_color = ("white", "white")
-                    elif cell_data.get('type') == 'task':
-                        cell_text = f"📋 {cell_data.get('task', '')}"
-                        cell_color = ("#4A90E2", "#4A90E2")
-                        text_color = ("white", "white")
-                    elif cell_data.get('type') == 'blocked':
-                        cell_text = "🚫 Blocked"
-                        cell_color = ("#FF6B6B", "#FF6B6B")
-                        text_color = ("white", "white")
+                cell_text, cell_color, text_color = self.timetable_cell_style(
+                    timetable_data.get(cell_key), module_colors)
 
                 cell_btn = ctk.CTkButton(
                     timetable_scroll,
                     text=cell_text,
-                    command=lambda d=day, t=time_slot: self.edit_timetable_cell(
-                        d, t),
+                    command=partial(self.edit_timetable_cell, day, time_slot),
                     fg_color=cell_color,
                     hover_color=cell_color,
                     text_color=text_color,
-                    font=ctk.CTkFont(size=8),
+                    font=cell_font,
                     corner_radius=4,
                     height=35  # Increased to match time labels
                 )
                 cell_btn.grid(row=row, column=col, padx=1, pady=1, sticky="ew")
+                self._timetable_buttons[cell_key] = cell_btn
 
         # Legend
         legend_frame = ctk.CTkFrame(self.right_frame, fg_color="transparent")
@@ -1297,7 +1783,7 @@ class CalendarApp(ctk.CTk):
         legend_title = ctk.CTkLabel(
             legend_frame,
             text="Legend:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self.font(12, "bold")
         )
         legend_title.pack(side="left", padx=(0, 10))
 
@@ -1305,12 +1791,12 @@ class CalendarApp(ctk.CTk):
         lesson_legend = ctk.CTkLabel(
             legend_frame,
             text="📚 Lessons",
-            fg_color=("#6DB176", "#6DB176"),
-            text_color=("white", "white"),
+            fg_color=_FG_NOTE,
+            text_color=_TXT_WHITE,
             corner_radius=4,
             width=70,
             height=22,
-            font=ctk.CTkFont(size=10)
+            font=self.font(10)
         )
         lesson_legend.pack(side="left", padx=3)
 
@@ -1318,12 +1804,12 @@ class CalendarApp(ctk.CTk):
         task_legend = ctk.CTkLabel(
             legend_frame,
             text="📋 Tasks",
-            fg_color=("#4A90E2", "#4A90E2"),
-            text_color=("white", "white"),
+            fg_color=_FG_TASK,
+            text_color=_TXT_WHITE,
             corner_radius=4,
             width=70,
             height=22,
-            font=ctk.CTkFont(size=10)
+            font=self.font(10)
         )
         task_legend.pack(side="left", padx=3)
 
@@ -1331,15 +1817,54 @@ class CalendarApp(ctk.CTk):
         blocked_legend = ctk.CTkLabel(
             legend_frame,
             text="🚫 Blocked",
-            fg_color=("#FF6B6B", "#FF6B6B"),
-            text_color=("white", "white"),
+            fg_color=_FG_BLOCKED,
+            text_color=_TXT_WHITE,
             corner_radius=4,
             width=70,
             height=22,
-            font=ctk.CTkFont(size=10)
+            font=self.font(10)
         )
         blocked_legend.pack(side="left", padx=3)
 
+    def timetable_cell_style(self, cell_data, module_colors):
+        """Returns the text, colour and text colour for a timetable cell."""
+        if not cell_data:
+            return _EMPTY_CELL_STYLE
+
+        cell_type = cell_data.get('type')
+        if cell_type == 'lesson':
+            module_name = cell_data.get('module', '')
+            room = cell_data.get('room', '')
+            cell_text = f"{module_name}\n{room}" if room else module_name
+            # Use module color if available
+            cell_color = module_colors.get(module_name, _FG_NOTE) if module_name else _FG_NOTE
+            return cell_text, cell_color, _TXT_WHITE
+
+        style = _CELL_STYLES.get(cell_type)
+        if style is None:
+            return _EMPTY_CELL_STYLE
+        cell_text, cell_color = style
+        return cell_text(cell_data), cell_color, _TXT_WHITE
+
+    def refresh_timetable_cell(self, cell_key):
+        """Restyles one timetable cell in place after it has been edited."""
+        cell_btn = self._timetable_buttons.get(cell_key)
+        if cell_btn is None or not cell_btn.winfo_exists():
+            self.show_timetable()
+            return
+
+        cell_data = self.timetable_data.get(cell_key)
+        module_name = (cell_data or {}).get('module', '')
+        module_info = self.modules_data.get(module_name)
+        module_colors = {}
+        if module_info is not None:
+            module_colors[module_name] = (module_info.get('color', '#6DB176'),) * 2
+
+        cell_text, cell_color, text_color = self.timetable_cell_style(
+            cell_data, module_colors)
+        cell_btn.configure(text=cell_text, fg_color=cell_color,
+                           hover_color=cell_color, text_color=text_color)
+
     def edit_timetable_cell(self, day, time_slot):
         """Opens a dialog to edit a timetable cell."""
         cell_key = f"{day}_{time_slot}"
@@ -1367,7 +1892,7 @@ class CalendarApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             edit_window,
             text=f"📅 Edit {day} {time_slot}",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.font(18, "bold")
         )
         title_label.grid(row=0, column=0, pady=(20, 10), padx=20, sticky="ew")
 
@@ -1381,8 +1906,8 @@ class CalendarApp(ctk.CTk):
         type_frame = ctk.CTkFrame(main_scroll, fg_color="transparent")
         type_frame.pack(pady=10, padx=20, fill="x")
 
-        ctk.CTkLabel(type_frame, text="Type:", font=ctk.CTkFont(
-            size=14, weight="bold")).pack(anchor="w")
+        ctk.CTkLabel(type_frame, text="Type:", font=self.font(
+            14, "bold")).pack(anchor="w")
 
         type_var = ctk.StringVar(value=cell_data.get('type', 'empty'))
 
@@ -1402,8 +1927,8 @@ class CalendarApp(ctk.CTk):
         lesson_frame = ctk.CTkFrame(main_scroll)
         lesson_frame.pack(pady=10, padx=20, fill="x")
 
-        ctk.CTkLabel(lesson_frame, text="Lesson Details:", font=ctk.CTkFont(
-            size=14, weight="bold")).pack(anchor="w", pady=(10, 5))
+        ctk.CTkLabel(lesson_frame, text="Lesson Details:", font=self.font(
+            14, "bold")).pack(anchor="w", pady=(10, 5))
 
         # Module selection dropdown
         ctk.CTkLabel(lesson_frame, text="Module:").pack(anchor="w")
@@ -1413,17 +1938,17 @@ class CalendarApp(ctk.CTk):
         module_dropdown = ctk.CTkComboBox(
             lesson_frame,
             variable=module_var,
-            dropdown_hover_color=("#1A3A47", "#1A3A47")
+            dropdown_hover_color=_HOV_HIGHLIGHT
         )
         module_dropdown.pack(fill="x", padx=10, pady=(0, 10))
 
         # Function to refresh module list in dropdown
         def refresh_module_dropdown():
-            # Reload modules data to get any new modules
-            self.modules_data = self.load_modules()
+            # Reload modules data only if the file changed since it was read
+            if self._modules_data is not None and self.modules_file_changed():
+                self.modules_data = self.load_modules()
             # Get list of available modules
-            module_names = list(self.modules_data.keys()
-                                ) if self.modules_data else []
+            module_names = list(self.module_names())
             module_dropdown.configure(values=module_names)
             return module_names
 
@@ -1438,9 +1963,9 @@ class CalendarApp(ctk.CTk):
             refresh_btn_frame,
             text="🔄 Refresh Modules",
             command=refresh_module_dropdown,
-            fg_color=("#482728", "#482728"),
-            hover_color=("#5A3233", "#5A3233"),
-            font=ctk.CTkFont(size=10),
+            fg_color=_FG_ACCENT,
+            hover_color=_HOV_ACCENT,
+            font=self.font(10),
             height=25,
             width=120
         )
@@ -1460,7 +1985,7 @@ class CalendarApp(ctk.CTk):
         room_dropdown = ctk.CTkComboBox(
             lesson_frame,
             variable=room_var,
-            dropdown_hover_color=("#1A3A47", "#1A3A47")
+            dropdown_hover_color=_HOV_HIGHLIGHT
         )
         room_dropdown.pack(fill="x", padx=10, pady=(0, 10))
 
@@ -1481,9 +2006,24 @@ class CalendarApp(ctk.CTk):
                 room_dropdown.configure(
                     values=['Room Unknown', 'Lab A', 'Lab B', 'Lecture Hall'])
 
-        # Update room options when module selection changes
+        # Update room options when module selection changes, collapsing
+        # rapid typing in the combobox into one update
+        pending_room_update = None
+        applied_module = module_var.get()
+
+        def apply_room_update():
+            nonlocal pending_room_update, applied_module
+            pending_room_update = None
+            # Skip if typing ended back on the module already applied
+            if edit_window.winfo_exists() and module_var.get() != applied_module:
+                applied_module = module_var.get()
+                update_room_options()
+
         def on_module_change(*args):
-            update_room_options()
+            nonlocal pending_room_update
+            if pending_room_update is not None:
+                edit_window.after_cancel(pending_room_update)
+            pending_room_update = edit_window.after(150, apply_room_update)
 
         module_var.trace('w', on_module_change)
 
@@ -1500,8 +2040,8 @@ class CalendarApp(ctk.CTk):
         task_frame = ctk.CTkFrame(main_scroll)
         task_frame.pack(pady=10, padx=20, fill="x")
 
-        ctk.CTkLabel(task_frame, text="Task Details:", font=ctk.CTkFont(
-            size=14, weight="bold")).pack(anchor="w", pady=(10, 5))
+        ctk.CTkLabel(task_frame, text="Task Details:", font=self.font(
+            14, "bold")).pack(anchor="w", pady=(10, 5))
 
         ctk.CTkLabel(task_frame, text="Task Name:").pack(anchor="w")
         task_entry = ctk.CTkEntry(
@@ -1539,14 +2079,14 @@ class CalendarApp(ctk.CTk):
 
             self.save_timetable()
             edit_window.destroy()
-            self.show_timetable()  # Refresh the timetable view
+            self.refresh_timetable_cell(cell_key)  # Restyle just this cell
 
         save_btn = ctk.CTkButton(
             btn_frame,
             text="💾 Save",
             command=save_cell,
-            fg_color=("#0B2027", "#0B2027"),
-            hover_color=("#1A3A47", "#1A3A47")
+            fg_color=_FG_HIGHLIGHT,
+            hover_color=_HOV_HIGHLIGHT
         )
         save_btn.pack(side="left", padx=10)
 
@@ -1554,8 +2094,8 @@ class CalendarApp(ctk.CTk):
             btn_frame,
             text="❌ Cancel",
             command=edit_window.destroy,
-            fg_color=("gray", "darkgray"),
-            hover_color=("darkgray", "gray")
+            fg_color=_FG_CANCEL,
+            hover_color=_HOV_CANCEL
         )
         cancel_btn.pack(side="left", padx=10)
 
@@ -1583,8 +2123,8 @@ class CalendarApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             settings_window,
             text="⚙️ Calendar Pro Settings",
-            font=ctk.CTkFont(size=24, weight="bold"),
-            text_color=("#0B2027", "#0B2027")
+            font=self.font(24, "bold"),
+            text_color=_FG_HIGHLIGHT
         )
         title_label.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="w")
 
@@ -1603,8 +2143,8 @@ class CalendarApp(ctk.CTk):
         storage_title = ctk.CTkLabel(
             storage_section,
             text="📁 Data Storage Location",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("#0B2027", "#0B2027")
+            font=self.font(18, "bold"),
+            text_color=_FG_HIGHLIGHT
         )
         storage_title.pack(anchor="w", pady=(0, 10))
 
@@ -1612,29 +2152,29 @@ class CalendarApp(ctk.CTk):
         description_label = ctk.CTkLabel(
             storage_section,
             text="Choose where to store your notes, timetable, and modules data.\nSelect a OneDrive folder to sync between devices.",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray40", "gray60"),
+            font=self.font(12),
+            text_color=_TXT_MUTED,
             justify="left"
         )
         description_label.pack(anchor="w", pady=(0, 15))
 
         # Current location display
         current_location_frame = ctk.CTkFrame(
-            storage_section, fg_color=("gray95", "gray10"))
+            storage_section, fg_color=_FG_PANEL)
         current_location_frame.pack(fill="x", pady=(0, 15))
 
         current_label = ctk.CTkLabel(
             current_location_frame,
             text="Current Location:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self.font(12, "bold")
         )
         current_label.pack(anchor="w", padx=15, pady=(10, 5))
 
         current_path_label = ctk.CTkLabel(
             current_location_frame,
-            text=load_storage_settings(),
-            font=ctk.CTkFont(size=11),
-            text_color=("gray20", "gray80"),
+            text=self.storage_location,
+            font=self.font(11),
+            text_color=_TXT_DIM,
             wraplength=500
         )
         current_path_label.pack(anchor="w", padx=15, pady=(0, 10))
@@ -1649,9 +2189,9 @@ class CalendarApp(ctk.CTk):
             text="📂 Choose New Location",
             command=lambda: self.choose_storage_location(
                 current_path_label, settings_window),
-            fg_color=("#0B2027", "#0B2027"),
-            hover_color=("#1A3A47", "#1A3A47"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            fg_color=_FG_HIGHLIGHT,
+            hover_color=_HOV_HIGHLIGHT,
+            font=self.font(14, "bold"),
             corner_radius=10,
             height=40
         )
@@ -1662,9 +2202,9 @@ class CalendarApp(ctk.CTk):
             buttons_frame,
             text="🔄 Reset to Default",
             command=lambda: self.reset_storage_location(current_path_label),
-            fg_color=("#482728", "#482728"),
-            hover_color=("#5A3233", "#5A3233"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            fg_color=_FG_ACCENT,
+            hover_color=_HOV_ACCENT,
+            font=self.font(14, "bold"),
             corner_radius=10,
             height=40
         )
@@ -1678,16 +2218,16 @@ class CalendarApp(ctk.CTk):
         info_title = ctk.CTkLabel(
             info_section,
             text="💡 Tip: OneDrive Sync",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=("white", "white")
+            font=self.font(14, "bold"),
+            text_color=_TXT_WHITE
         )
         info_title.pack(anchor="w", padx=15, pady=(10, 5))
 
         info_text = ctk.CTkLabel(
             info_section,
             text="To sync between devices:\n1. Choose a folder inside your OneDrive\n2. Install the app on other devices\n3. Set the same OneDrive folder on each device",
-            font=ctk.CTkFont(size=11),
-            text_color=("white", "white"),
+            font=self.font(11),
+            text_color=_TXT_WHITE,
             justify="left"
         )
         info_text.pack(anchor="w", padx=15, pady=(0, 10))
@@ -1700,9 +2240,9 @@ class CalendarApp(ctk.CTk):
             close_btn_frame,
             text="✅ Close",
             command=settings_window.destroy,
-            fg_color=("#0B2027", "#0B2027"),
-            hover_color=("#1A3A47", "#1A3A47"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            fg_color=_FG_HIGHLIGHT,
+            hover_color=_HOV_HIGHLIGHT,
+            font=self.font(14, "bold"),
             corner_radius=10,
             height=40
         )
@@ -1710,13 +2250,16 @@ class CalendarApp(ctk.CTk):
 
     def choose_storage_location(self, path_label, window):
         """Opens a folder dialog to choose storage location."""
-        current_location = load_storage_settings()
+        current_location = self.storage_location
         new_location = filedialog.askdirectory(
             title="Choose Calendar Data Storage Location",
             initialdir=current_location
         )
 
         if new_location:
+            # Write pending notes to the old location before switching
+            self.flush_notes()
+
             # Save the new location
             save_storage_settings(new_location)
             self.storage_location = new_location
@@ -1724,20 +2267,16 @@ class CalendarApp(ctk.CTk):
             # Update the display
             path_label.configure(text=new_location)
 
-            # Show confirmation and reload data
+            # Show confirmation first, then reload once it has been drawn
             self.show_location_changed_message(window, new_location)
-            self.reload_data_from_new_location()
+            self.after(50, self.reload_data_from_new_location)
 
     def reset_storage_location(self, path_label):
         """Resets storage location to default OneDrive location."""
-        default_location = r"C:\Users\umfhe\OneDrive - Middlesex University\A - Calendar Pro"
-        # Create the default directory if it doesn't exist
-        if not os.path.exists(default_location):
-            try:
-                os.makedirs(default_location, exist_ok=True)
-            except:
-                # If we can't create the OneDrive folder, fall back to current directory
-                default_location = os.getcwd()
+        default_location = default_storage_location()
+
+        # Write pending notes to the old location before switching
+        self.flush_notes()
 
         save_storage_settings(default_location)
         self.storage_location = default_location
@@ -1748,20 +2287,12 @@ class CalendarApp(ctk.CTk):
         """Reloads all data from the new storage location and refreshes UI."""
         # Reload all data files
         self.note_data = self.load_notes()
-        self.timetable_data = self.load_timetable()
-        self.modules_data = self.load_modules()
-
-        # Add preset module if no modules exist in new location
-        if not self.modules_data:
-            self.modules_data = {
-                "CST3510 Memory Analysis": {
-                    "color": "#45B7D1",
-                    "teacher": "Mr David Neilson",
-                    "rooms": ["Room Unknown", "Lab A", "Lab B", "Lecture Hall 1", "Lecture Hall 2"],
-                    "created": datetime.now().isoformat()
-                }
-            }
-            self.save_modules()
+        self.rebuild_note_counts()
+        self.rebuild_notes_index()
+        # Timetable and modules are re-read from the new location on next use
+        self._timetable_data = None
+        self._modules_data = None
+        self._module_names = None
 
         # Refresh the UI
         self.refresh_month_notifications()
@@ -1771,22 +2302,17 @@ class CalendarApp(ctk.CTk):
 
     def refresh_month_notifications(self):
         """Refreshes the notification counters for all months."""
-        current_year = datetime.now().year
+        current_month = self._today.month
 
-        # Clear existing notification labels
-        for month_name, canvas in self.month_note_labels.items():
-            if canvas:
-                canvas.destroy()
+        # Re-highlight the month buttons in place if the month has rolled over
+        if current_month != self._highlighted_month:
+            for month_name, month_btn in self.month_buttons.items():
+                month_btn.configure(**self.month_button_style(
+                    _MONTH_NUM[month_name] == current_month))
+            self._highlighted_month = current_month
 
-        # Recreate the month list with updated data
-        for widget in self.left_frame.winfo_children():
-            # Month buttons start at row 3
-            if hasattr(widget, 'grid_info') and widget.grid_info()['row'] >= 3:
-                widget.destroy()
-
-        self.month_buttons = {}
-        self.month_note_labels = {}
-        self.create_month_list()
+        # Update the existing badges rather than rebuilding the month list
+        self.update_month_counters()
 
     def show_location_changed_message(self, parent_window, new_location):
         """Shows a message about location change and data migration."""
@@ -1814,8 +2340,8 @@ class CalendarApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             msg_window,
             text="✅ Storage Location Updated",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("#0B2027", "#0B2027")
+            font=self.font(18, "bold"),
+            text_color=_FG_HIGHLIGHT
         )
         title_label.grid(row=0, column=0, padx=20, pady=(20, 10))
 
@@ -1838,7 +2364,7 @@ The app will create new files if none exist in the new location."""
         message_label = ctk.CTkLabel(
             content_frame,
             text=message_text,
-            font=ctk.CTkFont(size=12),
+            font=self.font(12),
             justify="left",
             wraplength=450
         )
@@ -1849,9 +2375,9 @@ The app will create new files if none exist in the new location."""
             msg_window,
             text="OK",
             command=msg_window.destroy,
-            fg_color=("#0B2027", "#0B2027"),
-            hover_color=("#1A3A47", "#1A3A47"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            fg_color=_FG_HIGHLIGHT,
+            hover_color=_HOV_HIGHLIGHT,
+            font=self.font(14, "bold"),
             corner_radius=10,
             height=40
         )
@@ -1881,7 +2407,7 @@ The app will create new files if none exist in the new location."""
         title_label = ctk.CTkLabel(
             modules_window,
             text="📚 Module Management",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.font(24, "bold")
         )
         title_label.grid(row=0, column=0, pady=(20, 10))
 
@@ -1903,7 +2429,7 @@ The app will create new files if none exist in the new location."""
         ctk.CTkLabel(
             new_module_frame,
             text="Add New Module",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.font(18, "bold")
         ).pack(pady=(15, 10))
 
         # Module name entry
@@ -1987,7 +2513,7 @@ The app will create new files if none exist in the new location."""
                 hover_color=color_hex,
                 border_width=3 if i == 0 else 0,  # Highlight first color initially
                 border_color="white" if i == 0 else None,
-                command=lambda c=color_hex: update_color_selection(c)
+                command=partial(update_color_selection, color_hex)
             )
             color_btn.grid(row=row, column=col, padx=2, pady=2)
             color_buttons.append(color_btn)
@@ -2004,7 +2530,7 @@ The app will create new files if none exist in the new location."""
         preview_label = ctk.CTkLabel(
             preview_container,
             text="Sample Module",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.font(12, "bold"),
             fg_color=selected_color.get(),
             text_color="white",
             corner_radius=6,
@@ -2019,9 +2545,21 @@ The app will create new files if none exist in the new location."""
                 fg_color=selected_color.get()
             )
 
-        # Update preview when module name changes
+        # Update preview when module name changes, collapsing a burst of
+        # keystrokes into one redraw
+        pending_preview = None
+
+        def apply_preview():
+            nonlocal pending_preview
+            pending_preview = None
+            if modules_window.winfo_exists():
+                update_preview()
+
         def on_name_change(*args):
-            update_preview()
+            nonlocal pending_preview
+            if pending_preview is not None:
+                modules_window.after_cancel(pending_preview)
+            pending_preview = modules_window.after(100, apply_preview)
 
         module_name_entry.bind('<KeyRelease>', on_name_change)
         teacher_entry.bind('<KeyRelease>', on_name_change)
@@ -2060,7 +2598,7 @@ The app will create new files if none exist in the new location."""
                     new_module_frame,
                     text="✅ Module added successfully!",
                     text_color="#0B2027",
-                    font=ctk.CTkFont(size=12, weight="bold")
+                    font=self.font(12, "bold")
                 )
                 success_label.pack(pady=5)
                 modules_window.after(2000, success_label.destroy)
@@ -2072,7 +2610,7 @@ The app will create new files if none exist in the new location."""
                     new_module_frame,
                     text="❌ Please enter a module name!",
                     text_color="red",
-                    font=ctk.CTkFont(size=12, weight="bold")
+                    font=self.font(12, "bold")
                 )
                 error_label.pack(pady=5)
                 modules_window.after(2000, error_label.destroy)
@@ -2082,7 +2620,7 @@ The app will create new files if none exist in the new location."""
                     new_module_frame,
                     text="❌ Module already exists!",
                     text_color="red",
-                    font=ctk.CTkFont(size=12, weight="bold")
+                    font=self.font(12, "bold")
                 )
                 error_label.pack(pady=5)
                 modules_window.after(2000, error_label.destroy)
@@ -2091,106 +2629,130 @@ The app will create new files if none exist in the new location."""
             new_module_frame,
             text="💾 Save Module",
             command=add_module,
-            fg_color=("#0B2027", "#0B2027"),
-            hover_color=("#1A3A47", "#1A3A47"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            fg_color=_FG_HIGHLIGHT,
+            hover_color=_HOV_HIGHLIGHT,
+            font=self.font(14, "bold"),
             height=35
         )
         add_btn.pack(pady=(10, 15))
 
+        # Existing modules section; rows are kept per module name and only
+        # created, updated or destroyed as modules change
+        existing_frame = ctk.CTkFrame(modules_scroll)
+        ctk.CTkLabel(
+            existing_frame,
+            text="Existing Modules",
+            font=self.font(18, "bold")
+        ).pack(pady=(15, 10))
+        module_rows = {}
+
+        def delete_module(name):
+            del self.modules_data[name]
+            self.save_modules()
+            refresh_existing_modules()  # Refresh instead of destroying window
+
+        def build_module_row(module_name):
+            module_item = ctk.CTkFrame(existing_frame)
+            module_item.pack(fill="x", padx=15, pady=5)
+
+            # Module info frame
+            info_frame = ctk.CTkFrame(
+                module_item, fg_color="transparent")
+            info_frame.pack(fill="x", side="left", expand=True)
+
+            # Color indicator
+            color_indicator = ctk.CTkLabel(
+                info_frame,
+                text="●",
+                font=self.font(20)
+            )
+            color_indicator.pack(side="left", padx=(10, 5))
+
+            # Module details frame
+            details_frame = ctk.CTkFrame(
+                info_frame, fg_color="transparent")
+            details_frame.pack(side="left", fill="x",
+                               expand=True, padx=(0, 10))
+
+            # Module name
+            name_label = ctk.CTkLabel(
+                details_frame,
+                text=module_name,
+                font=self.font(14, "bold"),
+                anchor="w"
+            )
+            name_label.pack(anchor="w")
+
+            # Teacher info
+            teacher_label = ctk.CTkLabel(
+                details_frame,
+                font=self.font(11),
+                text_color=_TXT_MUTED,
+                anchor="w"
+            )
+            teacher_label.pack(anchor="w")
+
+            # Rooms info
+            rooms_label = ctk.CTkLabel(
+                details_frame,
+                font=self.font(11),
+                text_color=_TXT_MUTED,
+                anchor="w"
+            )
+            rooms_label.pack(anchor="w")
+
+            # Delete button
+            delete_btn = ctk.CTkButton(
+                module_item,
+                text="🗑️",
+                width=30,
+                height=30,
+                command=partial(delete_module, module_name),
+                fg_color=_FG_DANGER,
+                hover_color=_HOV_DANGER
+            )
+            delete_btn.pack(side="right", padx=10, pady=5)
+
+            return {'frame': module_item, 'color_indicator': color_indicator,
+                    'teacher_label': teacher_label, 'rooms_label': rooms_label,
+                    'shown': None}
+
+        def update_module_row(row, module_info):
+            teacher = module_info.get('teacher', 'Unknown')
+            rooms = module_info.get('rooms', ['Room Unknown'])
+            # Rows whose details haven't changed keep their current text
+            shown = (module_info['color'], teacher, tuple(rooms))
+            if row['shown'] == shown:
+                return
+            row['shown'] = shown
+            rooms_text = ", ".join(rooms)
+            if len(rooms_text) > 35:
+                rooms_text = rooms_text[:32] + "..."
+            row['color_indicator'].configure(text_color=module_info['color'])
+            row['teacher_label'].configure(text=f"👨‍🏫 {teacher}")
+            row['rooms_label'].configure(text=f"🏛️ {rooms_text}")
+
         # Function to refresh existing modules display
         def refresh_existing_modules():
-            # Clear existing modules display
-            for widget in modules_scroll.winfo_children():
-                if widget != new_module_frame:
-                    widget.destroy()
-
-            # Recreate existing modules section
-            if self.modules_data:
-                existing_frame = ctk.CTkFrame(modules_scroll)
+            # Drop rows for modules that no longer exist
+            for module_name in list(module_rows):
+                if module_name not in self.modules_data:
+                    module_rows.pop(module_name)['frame'].destroy()
+
+            # Add rows for new modules and refresh the details of the rest
+            for module_name, module_info in self.modules_data.items():
+                row = module_rows.get(module_name)
+                if row is None:
+                    row = module_rows[module_name] = build_module_row(
+                        module_name)
+                update_module_row(row, module_info)
+
+            # Packed once it is filled in, so the scrollable frame lays out once
+            if not self.modules_data:
+                existing_frame.pack_forget()
+            elif not existing_frame.winfo_manager():
                 existing_frame.pack(fill="x", padx=10, pady=10)
 
-                ctk.CTkLabel(
-                    existing_frame,
-                    text="Existing Modules",
-                    font=ctk.CTkFont(size=18, weight="bold")
-                ).pack(pady=(15, 10))
-
-                for module_name, module_info in self.modules_data.items():
-                    module_item = ctk.CTkFrame(existing_frame)
-                    module_item.pack(fill="x", padx=15, pady=5)
-
-                    # Module info frame
-                    info_frame = ctk.CTkFrame(
-                        module_item, fg_color="transparent")
-                    info_frame.pack(fill="x", side="left", expand=True)
-
-                    # Color indicator
-                    color_indicator = ctk.CTkLabel(
-                        info_frame,
-                        text="●",
-                        font=ctk.CTkFont(size=20),
-                        text_color=module_info['color']
-                    )
-                    color_indicator.pack(side="left", padx=(10, 5))
-
-                    # Module details frame
-                    details_frame = ctk.CTkFrame(
-                        info_frame, fg_color="transparent")
-                    details_frame.pack(side="left", fill="x",
-                                       expand=True, padx=(0, 10))
-
-                    # Module name
-                    name_label = ctk.CTkLabel(
-                        details_frame,
-                        text=module_name,
-                        font=ctk.CTkFont(size=14, weight="bold"),
-                        anchor="w"
-                    )
-                    name_label.pack(anchor="w")
-
-                    # Teacher info
-                    teacher = module_info.get('teacher', 'Unknown')
-                    teacher_label = ctk.CTkLabel(
-                        details_frame,
-                        text=f"👨‍🏫 {teacher}",
-                        font=ctk.CTkFont(size=11),
-                        text_color=("gray40", "gray60"),
-                        anchor="w"
-                    )
-                    teacher_label.pack(anchor="w")
-
-                    # Rooms info
-                    rooms = module_info.get('rooms', ['Room Unknown'])
-                    rooms_text = ", ".join(rooms)
-                    if len(rooms_text) > 35:
-                        rooms_text = rooms_text[:32] + "..."
-                    rooms_label = ctk.CTkLabel(
-                        details_frame,
-                        text=f"🏛️ {rooms_text}",
-                        font=ctk.CTkFont(size=11),
-                        text_color=("gray40", "gray60"),
-                        anchor="w"
-                    )
-                    rooms_label.pack(anchor="w")
-
-                    # Delete button
-                    def delete_module(name=module_name):
-                        del self.modules_data[name]
-                        self.save_modules()
-                        refresh_existing_modules()  # Refresh instead of destroying window
-
-                    delete_btn = ctk.CTkButton(
-                        module_item,
-                        text="🗑️",
-                        width=30,
-                        height=30,
-                        command=delete_module,
-                        fg_color=("red", "darkred"),
-                        hover_color=("darkred", "red")
-                    )
-                    delete_btn.pack(side="right", padx=10, pady=5)
-
         # Initial display of existing modules
         refresh_existing_modules()
 
@@ -2199,65 +2761,72 @@ The app will create new files if none exist in the new location."""
             modules_window,
             text="✓ Done",
             command=modules_window.destroy,
-            fg_color=("#0B2027", "#0B2027"),
-            hover_color=("#1A3A47", "#1A3A47")
+            fg_color=_FG_HIGHLIGHT,
+            hover_color=_HOV_HIGHLIGHT
         )
         close_btn.grid(row=2, column=0, pady=10)
 
     def update_month_notification(self, month_name, note_count):
         """Updates the notification for a specific month."""
-        # Find the month number for the month name
-        month_num = list(calendar.month_name).index(month_name)
+        # Nothing to redraw if the badge already shows this count
+        if self._rendered_counts.get(month_name, 0) == note_count:
+            return
 
-        # Remove existing notification if any
         existing_notification = self.month_note_labels.get(month_name)
-        if existing_notification:
+
+        if note_count > 0 and existing_notification:
+            # Badge already shown, just change its number
+            existing_notification.configure(text=str(note_count))
+            self._rendered_counts[month_name] = note_count
+        elif note_count > 0:
+            # Create new notification now that there are notes
+            self.create_month_badge(month_name, note_count)
+        elif existing_notification:
+            # No notes left, remove the badge
             existing_notification.master.destroy()  # Destroy the entire notification frame
             self.month_note_labels[month_name] = None
+            self._rendered_counts.pop(month_name, None)
 
-        # Create new notification if there are notes
-        if note_count > 0:
-            # Create notification frame outside the button container
-            notification_frame = ctk.CTkFrame(
-                self.left_frame, fg_color="transparent")
-            notification_frame.grid(
-                row=month_num+2, column=1, padx=(5, 15), pady=2, sticky="ne")
-
-            # Try using Canvas to overlay text on image without background
-            import tkinter as tk
-            canvas = tk.Canvas(
+    def create_month_badge(self, month_name, note_count):
+        """Creates the bell badge showing a month's note count."""
+        month_num = _MONTH_NUM[month_name]
+
+        # Create notification frame outside the button container
+        notification_frame = ctk.CTkFrame(
+            self.left_frame, fg_color="transparent")
+        notification_frame.grid(
+            row=month_num+2, column=1, padx=(5, 15), pady=2, sticky="ne")
+
+        bell_icon = self._icons['bell_42']
+        if bell_icon is not None:
+            # Shared bell image with black text centred over it (no background)
+            badge = ctk.CTkLabel(
                 notification_frame,
-                width=42,
-                height=42,
-                highlightthickness=0,
-                bg='#dbdbdb'  # Use the exact background color you mentioned
+                text=str(note_count),
+                image=bell_icon,
+                compound="center",
+                font=self.font(14, "bold"),
+                text_color="black",
+                fg_color="transparent"
             )
-            canvas.pack()
+        else:
+            # Fallback to simple colored circle with text
+            badge = ctk.CTkLabel(
+                notification_frame,
+                text=str(note_count),
+                width=32,
+                height=32,
+                corner_radius=16,
+                font=self.font(16, "bold"),
+                text_color="white",
+                fg_color="red"
+            )
+        badge.pack()
 
-            # Load and draw the icon image on canvas
-            try:
-                from PIL import ImageTk
-                icon_pil = Image.open(resource_path(
-                    "bell.png")).resize((42, 42))
-                icon_photo = ImageTk.PhotoImage(icon_pil)
-                canvas.create_image(21, 21, image=icon_photo)
-                # Keep a reference to prevent garbage collection
-                canvas.image = icon_photo
-
-                # Draw text with black color (no background circle)
-                canvas.create_text(21, 21, text=str(note_count),
-                                   font=("Arial", 14, "bold"),
-                                   fill="black")
-            except Exception as e:
-                # Fallback to simple colored circle with text
-                canvas.create_oval(5, 5, 37, 37, fill="red",
-                                   outline="white", width=2)
-                canvas.create_text(21, 21, text=str(note_count),
-                                   font=("Arial", 16, "bold"),
-                                   fill="white")
-
-            # Store the canvas for future updates
-            self.month_note_labels[month_name] = canvas
+        # Store the badge for future updates
+        self.month_note_labels[month_name] = badge
+        self._rendered_counts[month_name] = note_count
+        return badge
 
     def enter_delete_mode(self):
         """Enters delete mode for mass note deletion."""
@@ -2276,36 +2845,66 @@ The app will create new files if none exist in the new location."""
     def toggle_day_selection(self, day, year, month_name):
         """Toggles selection of a day for deletion (only if it has notes)."""
         # Only allow selection of days that have notes
-        day_notes = self.note_data.get(str(year), {}).get(
-            month_name, {}).get(str(day), [])
-        if day_notes:  # Only select days that have notes
+        if day in self._days_with_notes:
             if day in self.selected_days:
                 self.selected_days.remove(day)
             else:
                 self.selected_days.add(day)
-            # Refresh the calendar to update selection display
-            self.show_calendar(self.current_month)
+            # Without live day widgets, fall back to a full redraw
+            if day not in self._day_buttons:
+                self.show_calendar(self.current_month)
+                return
+
+            # Update just this day and the confirm button's count
+            self.refresh_day_cell(day, year, month_name)
+            self._confirm_btn.configure(
+                text=f"✓ Delete {len(self.selected_days)} Days")
 
     def confirm_delete_selected(self):
         """Confirms and deletes notes for all selected days."""
         if not self.selected_days:
             return
 
+        # Sort the selection once for the dialog text and the deletion loop
+        self._sorted_selected = tuple(sorted(self.selected_days))
+
+        # The dialog is built once and reused (hidden between deletions)
+        if self._confirm_window is None or not self._confirm_window.winfo_exists():
+            self.build_confirm_window()
+        confirm_window = self._confirm_window
+
+        # Center window on parent
+        x = (self.winfo_x() + (self.winfo_width() // 2)) - (450 // 2)
+        y = (self.winfo_y() + (self.winfo_height() // 2)) - (300 // 2)
+        confirm_window.geometry(f"450x300+{x}+{y}")
+
+        # Get details
+        current_year = self._today.year
+        month_name = _MONTH_NAMES[self.current_month]
+        selected_count = len(self._sorted_selected)
+
+        self._confirm_main_msg.configure(
+            text=f"Delete notes for {selected_count} day{'s' if selected_count != 1 else ''}?")
+        self._confirm_details_msg.configure(
+            text=f"Month: {month_name} {current_year}")
+        self._confirm_days_msg.configure(
+            text=f"Days: {', '.join(map(str, self._sorted_selected))}")
+
+        self.show_dialog(confirm_window)
+
+    def build_confirm_window(self):
+        """Creates the hidden delete confirmation dialog and keeps its labels."""
         # Create confirmation dialog
         confirm_window = ctk.CTkToplevel(self)
+        confirm_window.withdraw()
         confirm_window.title("Confirm Deletion")
         confirm_window.geometry("450x300")
         confirm_window.resizable(False, False)
 
-        # Center the window and make it modal
+        # Keep the window above its parent (made modal when shown)
         confirm_window.transient(self)
-        confirm_window.grab_set()
-
-        # Center window on parent
-        confirm_window.update_idletasks()
-        x = (self.winfo_x() + (self.winfo_width() // 2)) - (450 // 2)
-        y = (self.winfo_y() + (self.winfo_height() // 2)) - (300 // 2)
-        confirm_window.geometry(f"450x300+{x}+{y}")
+        confirm_window.protocol(
+            "WM_DELETE_WINDOW", lambda: self.hide_dialog(confirm_window))
 
         # Main container
         main_frame = ctk.CTkFrame(confirm_window, fg_color="transparent")
@@ -2318,46 +2917,40 @@ The app will create new files if none exist in the new location."""
         title_label = ctk.CTkLabel(
             title_frame,
             text="⚠️ Confirm Deletion",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self.font(24, "bold"),
             text_color=("red", "red")
         )
         title_label.pack()
 
         # Message container
         message_frame = ctk.CTkFrame(
-            main_frame, corner_radius=10, fg_color=("gray95", "gray10"))
+            main_frame, corner_radius=10, fg_color=_FG_PANEL)
         message_frame.pack(fill="both", expand=True, pady=(0, 20))
 
-        # Get details
-        current_year = datetime.now().year
-        month_name = calendar.month_name[self.current_month]
-        selected_count = len(self.selected_days)
-
         # Main message
         main_msg = ctk.CTkLabel(
             message_frame,
-            text=f"Delete notes for {selected_count} day{'s' if selected_count != 1 else ''}?",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("#0B2027", "#0B2027")
+            text="",
+            font=self.font(18, "bold"),
+            text_color=_FG_HIGHLIGHT
         )
         main_msg.pack(pady=(20, 10))
 
         # Details
         details_msg = ctk.CTkLabel(
             message_frame,
-            text=f"Month: {month_name} {current_year}",
-            font=ctk.CTkFont(size=14),
-            text_color=("gray30", "gray70")
+            text="",
+            font=self.font(14),
+            text_color=_TXT_SUBTLE
         )
         details_msg.pack(pady=5)
 
         # Days list
-        days_text = f"Days: {', '.join(map(str, sorted(self.selected_days)))}"
         days_msg = ctk.CTkLabel(
             message_frame,
-            text=days_text,
-            font=ctk.CTkFont(size=14),
-            text_color=("gray30", "gray70")
+            text="",
+            font=self.font(14),
+            text_color=_TXT_SUBTLE
         )
         days_msg.pack(pady=5)
 
@@ -2365,7 +2958,7 @@ The app will create new files if none exist in the new location."""
         warning_msg = ctk.CTkLabel(
             message_frame,
             text="This action cannot be undone!",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.font(14, "bold"),
             text_color=("red", "red")
         )
         warning_msg.pack(pady=(10, 20))
@@ -2378,10 +2971,10 @@ The app will create new files if none exist in the new location."""
         delete_btn = ctk.CTkButton(
             btn_frame,
             text="🗑️ Delete All",
-            command=lambda: self.execute_deletion(confirm_window),
-            fg_color=("red", "darkred"),
-            hover_color=("darkred", "red"),
-            font=ctk.CTkFont(size=16, weight="bold"),
+            command=self.execute_deletion,
+            fg_color=_FG_DANGER,
+            hover_color=_HOV_DANGER,
+            font=self.font(16, "bold"),
             corner_radius=10,
             height=40,
             width=150
@@ -2392,54 +2985,71 @@ The app will create new files if none exist in the new location."""
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="❌ Cancel",
-            command=confirm_window.destroy,
-            fg_color=("gray", "darkgray"),
-            hover_color=("darkgray", "gray"),
-            font=ctk.CTkFont(size=16, weight="bold"),
+            command=lambda: self.hide_dialog(confirm_window),
+            fg_color=_FG_CANCEL,
+            hover_color=_HOV_CANCEL,
+            font=self.font(16, "bold"),
             corner_radius=10,
             height=40,
             width=150
         )
         cancel_btn.pack(side="right", padx=(10, 0))
 
-    def execute_deletion(self, confirm_window):
+        self._confirm_window = confirm_window
+        self._confirm_main_msg = main_msg
+        self._confirm_details_msg = details_msg
+        self._confirm_days_msg = days_msg
+
+    def execute_deletion(self):
         """Executes the deletion of selected days' notes."""
-        current_year = datetime.now().year
-        month_name = calendar.month_name[self.current_month]
-        year_str = str(current_year)
-
-        # Delete notes for selected days
-        if year_str in self.note_data and month_name in self.note_data[year_str]:
-            for day in self.selected_days:
-                day_str = str(day)
-                if day_str in self.note_data[year_str][month_name]:
-                    del self.note_data[year_str][month_name][day_str]
-
-        # Save updated data
-        notes_file_path = get_data_file_path('notes.json')
-        with open(notes_file_path, 'w') as f:
-            json.dump(self.note_data, f, indent=4)
+        current_year = self._today.year
+        month_name = _MONTH_NAMES[self.current_month]
+
+        # Delete notes for selected days, saving once for the whole batch
+        removed_days = 0
+        month_data = self.note_data.get(current_year, {}).get(month_name)
+        if month_data is not None:
+            with self.batched_writes():
+                for day in self._sorted_selected:
+                    removed_notes = month_data.pop(day, None)
+                    if removed_notes is None:
+                        continue
+                    removed_days += bool(removed_notes)
+                    self.index_note_day(current_year, month_name, day)
+                    self.schedule_notes_flush()
 
         # Update the month counter
-        note_count = len(
-            [day for day, notes in self.note_data.get(year_str, {}).get(month_name, {}).items() if notes])
-        self.update_month_notification(month_name, note_count)
+        self.adjust_month_count(current_year, month_name, -removed_days)
+        self.queue_month_notification(month_name)
 
         # Close confirmation window
-        confirm_window.destroy()
+        self.hide_dialog(self._confirm_window)
 
         # Exit delete mode and refresh calendar
         self.exit_delete_mode()
 
+    def queue_month_notification(self, month_name):
+        """Marks a month's badge for one coalesced update once Tk is idle."""
+        if not self._pending_notifications:
+            self.after_idle(self.flush_month_notifications)
+        self._pending_notifications.add(month_name)
+
+    def flush_month_notifications(self):
+        """Brings every queued month badge up to date with its live count."""
+        current_year = self._today.year
+        pending, self._pending_notifications = self._pending_notifications, set()
+        for month_name in pending:
+            note_count = self.month_note_counts.get(
+                (current_year, month_name), 0)
+            self.update_month_notification(month_name, note_count)
+
     def update_month_counters(self):
         """Updates all month note counters on the left panel."""
-        current_year = datetime.now().year
+        current_year = self._today.year
 
-        for month_name in calendar.month_name[1:]:
-            month_data = self.note_data.get(
-                str(current_year), {}).get(month_name, {})
-            note_count = len(
-                [day for day, notes in month_data.items() if notes])
+        for month_name in _MONTH_NUM:  # Month names in calendar order
+            note_count = self.month_note_counts.get(
+                (current_year, month_name), 0)
 
             self.update_month_notification(month_name, note_count)
 
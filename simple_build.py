@@ -57,19 +57,20 @@ def build_simple():
     print("\n⏳ This may take 2-5 minutes, please wait...")
 
     try:
-        # Run with real-time output
+        # Run with real-time output on an unbuffered binary pipe
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
+            bufsize=0
         )
 
-        # Print output in real-time
-        for line in process.stdout:
-            if line.strip():
-                print(f"   {line.strip()}")
+        # Pass output through in chunks as it arrives, so \r progress
+        # updates show up without waiting for a full line
+        sys.stdout.flush()
+        while chunk := process.stdout.read(4096):
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
 
         process.wait()
 
@@ -111,12 +112,12 @@ def create_distribution():
     # Copy executable
     exe_source = "dist/CalendarPro.exe"
     if os.path.exists(exe_source):
-        shutil.copy2(exe_source, dist_folder)
+        shutil.copyfile(exe_source, os.path.join(dist_folder, "CalendarPro.exe"))
         print(f"✅ Copied executable to {dist_folder}/")
 
     # Copy readme
     if os.path.exists("README.md"):
-        shutil.copy2("README.md", dist_folder)
+        shutil.copyfile("README.md", os.path.join(dist_folder, "README.md"))
         print("✅ Copied README.md")
 
     # Create simple instructions
@@ -151,8 +152,8 @@ The application creates these files automatically:
 Enjoy using Calendar Pro!
 """
 
-    with open(f"{dist_folder}/README.txt", 'w') as f:
-        f.write(instructions)
+    # Write the instructions in a single call
+    Path(dist_folder, "README.txt").write_text(instructions, encoding='utf-8')
 
     print(f"✅ Created distribution package: {dist_folder}/")
 